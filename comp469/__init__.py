@@ -0,0 +1,29 @@
+"""
+Search and optimization algorithms: 8-queens solvers (comp469.nqueens),
+8-puzzle searches (comp469.puzzle), 8-puzzle state-space analysis
+(comp469.statespace) and tic-tac-toe engines (comp469.tictactoe), with
+opt-in instrumentation in comp469.telemetry and progress-streaming helpers
+in comp469.streaming. comp469.rng derives independent, replayable random
+streams for the stochastic solvers.
+
+Submodules are imported on first attribute access, so importing comp469
+does no work and pulls in no optional dependencies.
+"""
+import importlib
+
+SUBMODULES = (
+    "cli",
+    "nqueens",
+    "puzzle",
+    "rng",
+    "statespace",
+    "streaming",
+    "telemetry",
+    "tictactoe",
+)
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,22 @@
+import argparse
+import importlib
+
+# Each command's module is only imported when that command runs.
+COMMANDS = {
+    "genetic": "comp469.nqueens.genetic",
+    "hill-climb": "comp469.nqueens.hill_climbing",
+    "anneal": "comp469.nqueens.annealing",
+    "puzzle": "comp469.puzzle",
+    "tictactoe": "comp469.tictactoe.game",
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="comp469",
+        description="Run one of the solvers. Pass -h after a command for its options.",
+    )
+    parser.add_argument("command", choices=COMMANDS)
+    parser.add_argument("args", nargs=argparse.REMAINDER)
+    args = parser.parse_args(argv)
+    return importlib.import_module(COMMANDS[args.command]).main(args.args)
@@ -0,0 +1,55 @@
+"""
+8-queens solvers: hill climbing, simulated annealing and a genetic
+algorithm, over boards stored as 8x8 lists of 0s and 1s.
+"""
+from .annealing import (
+    get_random_neighbor,
+    resume_simulated_annealing,
+    simulated_annealing,
+    simulated_annealing_stream,
+)
+from .board import create_board, get_attacking_pairs, place_queens, print_board
+from .checkpoint import load_checkpoint, save_checkpoint
+from .genetic import (
+    SELECTION_METHODS,
+    genetic_algorithm_stream,
+    mutate,
+    optimized_fitness,
+    optimized_genetic_algorithm,
+    optimized_get_attacking_pairs,
+    rank_selection,
+    reproduce,
+    resume_genetic_algorithm,
+    roulette_selection,
+    stochastic_universal_selection,
+    tournament_selection,
+)
+from .hill_climbing import get_neighbors, hill_climb, hill_climb_stream
+
+__all__ = [
+    "SELECTION_METHODS",
+    "create_board",
+    "genetic_algorithm_stream",
+    "get_attacking_pairs",
+    "get_neighbors",
+    "get_random_neighbor",
+    "hill_climb",
+    "hill_climb_stream",
+    "load_checkpoint",
+    "mutate",
+    "optimized_fitness",
+    "optimized_genetic_algorithm",
+    "optimized_get_attacking_pairs",
+    "place_queens",
+    "print_board",
+    "rank_selection",
+    "reproduce",
+    "resume_genetic_algorithm",
+    "resume_simulated_annealing",
+    "roulette_selection",
+    "save_checkpoint",
+    "simulated_annealing",
+    "simulated_annealing_stream",
+    "stochastic_universal_selection",
+    "tournament_selection",
+]
@@ -0,0 +1,284 @@
+import argparse
+import math
+import random
+import time
+
+from ..rng import run_rng
+from ..streaming import Snapshot, run_stream
+from ..telemetry import (
+    add_telemetry_arguments,
+    export_telemetry,
+    instrumented,
+    telemetry_from_arguments,
+)
+from .board import create_board, get_attacking_pairs, place_queens, print_board
+from .checkpoint import (
+    AnnealingCheckpoint,
+    add_checkpoint_arguments,
+    load_checkpoint,
+    run_batch,
+    save_checkpoint,
+)
+
+
+def get_random_neighbor(board, rng=None):
+    if rng is None:
+        rng = random
+    new_board = [r[:] for r in board]
+    col = rng.randint(0, 7)
+    row = rng.randint(0, 7)
+    for r in range(8):
+        new_board[r][col] = 0
+    new_board[row][col] = 1
+    return new_board
+
+
+@instrumented
+def simulated_annealing(
+    board,
+    max_steps=1000,
+    initial_temp=100.0,
+    cooling_rate=0.95,
+    telemetry=None,
+    checkpoint_path=None,
+    checkpoint_every=100,
+    rng=None,
+):
+    """
+    Anneals board for up to max_steps steps, drawing from rng (the random
+    module if None; see comp469.rng). With checkpoint_path set, the chain is
+    checkpointed there every checkpoint_every steps; see
+    resume_simulated_annealing.
+
+    Returns:
+        tuple of the final board and its attacking pairs
+    """
+    stream = simulated_annealing_stream(
+        board,
+        max_steps,
+        initial_temp,
+        cooling_rate,
+        telemetry,
+        checkpoint_path,
+        checkpoint_every,
+        rng,
+    )
+    return run_stream(stream)[0]
+
+
+def simulated_annealing_stream(
+    board,
+    max_steps=1000,
+    initial_temp=100.0,
+    cooling_rate=0.95,
+    telemetry=None,
+    checkpoint_path=None,
+    checkpoint_every=100,
+    rng=None,
+):
+    """
+    simulated_annealing as a generator: yields a Snapshot of the best board
+    seen after every step and returns the same (board, attacks) pair, the
+    final state of the chain. max_steps may be None for no limit. A new
+    budget sent in continues the same cooling schedule; see
+    comp469.streaming.
+    """
+    return anneal(
+        board,
+        0,
+        max_steps,
+        initial_temp,
+        cooling_rate,
+        telemetry,
+        checkpoint_path,
+        checkpoint_every,
+        random if rng is None else rng,
+    )
+
+
+@instrumented
+def resume_simulated_annealing(path, telemetry=None, checkpoint_every=100, rng=None):
+    """
+    Continues the run checkpointed at path, restoring rng (the random
+    module if None) to its state at the checkpoint, so the result is the
+    one the original run would have returned. Further checkpoints go to the
+    same path.
+
+    Returns:
+        tuple of the final board and its attacking pairs
+    """
+    checkpoint = load_checkpoint(path)
+    if not isinstance(checkpoint, AnnealingCheckpoint):
+        raise ValueError(f"{path} is not a simulated annealing checkpoint")
+    if rng is None:
+        rng = random
+    rng.setstate(checkpoint.rng_state)
+    stream = anneal(
+        checkpoint.board,
+        checkpoint.step,
+        checkpoint.max_steps,
+        checkpoint.temp,
+        checkpoint.cooling_rate,
+        telemetry,
+        path,
+        checkpoint_every,
+        rng,
+    )
+    return run_stream(stream)[0]
+
+
+def anneal(
+    board,
+    step,
+    max_steps,
+    temp,
+    cooling_rate,
+    telemetry,
+    checkpoint_path,
+    checkpoint_every,
+    rng,
+):
+    if checkpoint_path is not None and checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    first_step = step
+    current_board = board
+    current_attacks = get_attacking_pairs(current_board)
+    best_board, best_attacks = current_board, current_attacks
+
+    while max_steps is None or step < max_steps:
+        if current_attacks == 0:
+            break
+
+        if (
+            checkpoint_path is not None
+            and step != first_step
+            and not step % checkpoint_every
+        ):
+            save_checkpoint(
+                checkpoint_path,
+                AnnealingCheckpoint(
+                    step,
+                    max_steps,
+                    temp,
+                    cooling_rate,
+                    current_board,
+                    rng.getstate(),
+                ),
+            )
+
+        neighbor = get_random_neighbor(current_board, rng)
+        neighbor_attacks = get_attacking_pairs(neighbor)
+
+        if neighbor_attacks < current_attacks:
+            current_board = neighbor
+            current_attacks = neighbor_attacks
+            accepted = True
+        else:
+            delta = neighbor_attacks - current_attacks
+            if temp > 0:
+                probability = math.exp(-delta / temp)
+            else:
+                # temp has cooled all the way to 0.0; take the limit, where
+                # sideways moves are always accepted and worse ones never.
+                probability = 1.0 if delta == 0 else 0.0
+            accepted = rng.uniform(0, 1) < probability
+            if accepted:
+                current_board = neighbor
+                current_attacks = neighbor_attacks
+
+        if telemetry is not None:
+            telemetry.count("evaluations")
+            if accepted:
+                telemetry.count("accepted_moves")
+            telemetry.sample(step, cost=current_attacks, temperature=temp)
+        temp *= cooling_rate
+        if current_attacks < best_attacks:
+            best_board, best_attacks = current_board, current_attacks
+        step += 1
+        budget = yield Snapshot(step, best_attacks, best_board)
+        if budget is not None:
+            max_steps = step + budget
+
+    return current_board, current_attacks
+
+
+def measure_performance_simulated_annealing(
+    runs=100,
+    telemetry=None,
+    seed=None,
+    checkpoint_path=None,
+    checkpoint_every=100,
+    resume=False,
+    **options,
+):
+    def run_rng_for(run):
+        return None if seed is None else run_rng(seed, run)
+
+    def start_run(run, run_path):
+        rng = run_rng_for(run)
+        initial_board = place_queens(create_board(), rng)
+        return simulated_annealing(
+            initial_board,
+            telemetry=telemetry,
+            checkpoint_path=run_path,
+            checkpoint_every=checkpoint_every,
+            rng=rng,
+            **options,
+        )
+
+    def resume_run(run, run_path):
+        return resume_simulated_annealing(
+            run_path,
+            telemetry=telemetry,
+            checkpoint_every=checkpoint_every,
+            rng=run_rng_for(run),
+        )
+
+    start_time = time.time()
+    solutions_found = run_batch(start_run, resume_run, runs, checkpoint_path, resume)
+    end_time = time.time()
+    elapsed_time = end_time - start_time
+    success_rate = solutions_found / runs
+    return elapsed_time, success_rate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="comp469 anneal", description="Solve 8-queens by simulated annealing."
+    )
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed each run's own random stream from SEED, so runs can be replayed",
+    )
+    add_telemetry_arguments(parser)
+    add_checkpoint_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume needs --checkpoint")
+
+    # The example gets the stream after the batch's, so it can be replayed too.
+    example_rng = None if args.seed is None else run_rng(args.seed, args.runs)
+    initial_board = place_queens(create_board(), example_rng)
+    solution, attacks = simulated_annealing(initial_board, rng=example_rng)
+
+    telemetry = telemetry_from_arguments(args, "simulated_annealing")
+    elapsed_time, success_rate = measure_performance_simulated_annealing(
+        args.runs,
+        telemetry,
+        args.seed,
+        checkpoint_path=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        resume=args.resume,
+    )
+    export_telemetry(args, [telemetry])
+    print(
+        f"Simulated Annealing Performance: Time = {elapsed_time:.2f}s, "
+        f"Success Rate = {success_rate:.2%}"
+    )
+    print("Initial Board:")
+    print_board(initial_board)
+    print("Solution Board:")
+    print_board(solution)
+    print(f"Attacking Pairs: {attacks}")
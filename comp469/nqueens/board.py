@@ -0,0 +1,72 @@
+import random
+
+
+def print_board(board):
+    """
+    Prints the chess board to the console by joining
+    cells with a space between them.
+
+    Args:
+        board (list of list of int)
+        An 8x8 list representing the chess board, where
+        each cell contains 0 for empty or 1 for a queen.
+    """
+    for row in board:
+        print(" ".join(str(cell) for cell in row))
+    print()
+
+
+def create_board():
+    """
+    Creates an 8x8 Chessboard initialized with all 0's
+
+    Returns:
+        list of list of int
+    """
+    return [[0] * 8 for _ in range(8)]
+
+
+def place_queens(board, rng=None):
+    """
+    Randomly places 8 queens on the board, one for each column, drawing
+    from rng (the random module if None; see comp469.rng).
+
+    Returns:
+        list of list of int
+    """
+    if rng is None:
+        rng = random
+    for i in range(8):
+        row = rng.randint(0, 7)
+        board[row][i] = 1
+    return board
+
+
+def get_attacking_pairs(board):
+    """
+    Calculates the number of pairs where queens are attacking each other.
+    Since each pair gets counted twice, we have to return half the number of
+    attacking pairs.
+
+    Returns:
+        int
+    """
+    attacking_pairs = 0
+    for i in range(8):
+        for j in range(8):
+            if board[i][j] == 1:
+                for k in range(8):
+                    if k != j and board[i][k] == 1:
+                        attacking_pairs += 1
+                    if k != i and board[k][j] == 1:
+                        attacking_pairs += 1
+                for k in range(1, 8):
+                    if i + k < 8 and j + k < 8 and board[i + k][j + k] == 1:
+                        attacking_pairs += 1
+                    if i - k >= 0 and j + k < 8 and board[i - k][j + k] == 1:
+                        attacking_pairs += 1
+                    if i + k < 8 and j - k >= 0 and board[i + k][j - k] == 1:
+                        attacking_pairs += 1
+                    if i - k >= 0 and j - k >= 0 and board[i - k][j - k] == 1:
+                        attacking_pairs += 1
+    return attacking_pairs // 2
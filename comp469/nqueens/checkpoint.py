@@ -0,0 +1,253 @@
+"""
+Checkpoints for long simulated annealing and genetic algorithm runs.
+
+A checkpoint holds everything the solver loop keeps in local variables at
+the top of a step or generation, including the state of its random
+generator (see comp469.rng), so resuming from it replays the rest of the
+run exactly as it would have gone uninterrupted. Boards are packed one bit
+per square, eight bytes each.
+
+run_batch keeps a batch of runs going across restarts: each run
+checkpoints to a file of its own, removed when the run finishes, and a
+small progress file records how many runs are done.
+"""
+import argparse
+import os
+import struct
+from collections import namedtuple
+
+CHECKPOINT_MAGIC = b"NQCKPT01"
+ANNEALING = 0
+GENETIC = 1
+# Magic, solver kind, step or generation to resume at, and the limit on it
+# (0 for none).
+CHECKPOINT_HEADER = struct.Struct("<8sBII")
+# random.getstate(): version, 624 Mersenne Twister words and their position,
+# then whether gauss_next is set and its value.
+RNG_STATE = struct.Struct("<B625I?d")
+# Temperature and cooling rate.
+ANNEALING_STATE = struct.Struct("<dd")
+# Mutation rate, selection method and population size.
+GENETIC_STATE = struct.Struct("<d16sI")
+BOARD = struct.Struct("<Q")
+BATCH_MAGIC = b"NQBATCH1"
+# Magic, runs finished, and how many of them found a solution.
+BATCH_PROGRESS = struct.Struct("<8sII")
+
+AnnealingCheckpoint = namedtuple(
+    "AnnealingCheckpoint",
+    ["step", "max_steps", "temp", "cooling_rate", "board", "rng_state"],
+)
+GeneticCheckpoint = namedtuple(
+    "GeneticCheckpoint",
+    [
+        "generation",
+        "max_generations",
+        "mutation_rate",
+        "selection",
+        "population",
+        "rng_state",
+    ],
+)
+
+
+def pack_board(board):
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            if board[row][col]:
+                bits |= 1 << (row * 8 + col)
+    return bits
+
+
+def unpack_board(bits):
+    return [[(bits >> (row * 8 + col)) & 1 for col in range(8)] for row in range(8)]
+
+
+def pack_rng_state(rng_state):
+    version, words, gauss_next = rng_state
+    return RNG_STATE.pack(version, *words, gauss_next is not None, gauss_next or 0.0)
+
+
+def unpack_rng_state(data, offset):
+    fields = RNG_STATE.unpack_from(data, offset)
+    gauss_next = fields[-1] if fields[-2] else None
+    return fields[0], tuple(fields[1:-2]), gauss_next
+
+
+def save_checkpoint(path, checkpoint):
+    """
+    Writes an AnnealingCheckpoint or GeneticCheckpoint to path, atomically
+    (see write_atomically).
+    """
+    if isinstance(checkpoint, AnnealingCheckpoint):
+        header = CHECKPOINT_HEADER.pack(
+            CHECKPOINT_MAGIC, ANNEALING, checkpoint.step, checkpoint.max_steps or 0
+        )
+        state = ANNEALING_STATE.pack(checkpoint.temp, checkpoint.cooling_rate)
+        boards = [checkpoint.board]
+    else:
+        header = CHECKPOINT_HEADER.pack(
+            CHECKPOINT_MAGIC,
+            GENETIC,
+            checkpoint.generation,
+            checkpoint.max_generations or 0,
+        )
+        state = GENETIC_STATE.pack(
+            checkpoint.mutation_rate,
+            checkpoint.selection.encode(),
+            len(checkpoint.population),
+        )
+        boards = checkpoint.population
+    data = [header, pack_rng_state(checkpoint.rng_state), state]
+    data.extend(BOARD.pack(pack_board(board)) for board in boards)
+    write_atomically(path, b"".join(data))
+
+
+def write_atomically(path, data):
+    """
+    Writes data to path. It is written and synced next to path first and
+    then renamed over it, so a process killed mid-write leaves the previous
+    file intact.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path):
+    """
+    Reads a checkpoint written by save_checkpoint.
+
+    Returns:
+        AnnealingCheckpoint or GeneticCheckpoint
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, kind, step, limit = CHECKPOINT_HEADER.unpack_from(data)
+    limit = limit or None
+    if magic != CHECKPOINT_MAGIC:
+        raise ValueError(f"{path} is not an 8-queens checkpoint")
+    offset = CHECKPOINT_HEADER.size
+    rng_state = unpack_rng_state(data, offset)
+    offset += RNG_STATE.size
+    if kind == ANNEALING:
+        temp, cooling_rate = ANNEALING_STATE.unpack_from(data, offset)
+        count = 1
+        offset += ANNEALING_STATE.size
+    else:
+        mutation_rate, selection, count = GENETIC_STATE.unpack_from(data, offset)
+        offset += GENETIC_STATE.size
+    if len(data) != offset + count * BOARD.size:
+        raise ValueError(f"{path} is truncated")
+    boards = [unpack_board(bits) for (bits,) in BOARD.iter_unpack(data[offset:])]
+    if kind == ANNEALING:
+        return AnnealingCheckpoint(
+            step, limit, temp, cooling_rate, boards[0], rng_state
+        )
+    return GeneticCheckpoint(
+        step,
+        limit,
+        mutation_rate,
+        selection.rstrip(b"\0").decode(),
+        boards,
+        rng_state,
+    )
+
+
+def run_checkpoint_path(path, index):
+    return f"{path}.run{index}"
+
+
+def run_batch(start_run, resume_run, runs, path=None, resume=False, on_result=None):
+    """
+    Runs runs runs in turn and counts those that find a solution.
+    start_run(index, checkpoint_path) starts run index and
+    resume_run(index, checkpoint_path) continues it from its checkpoint;
+    both return a (board, attacks) pair, and on_result(index, board,
+    attacks), if given, is called with it.
+
+    With path set, run index checkpoints to path.run<index>, removed once
+    the run is over, and the progress of the batch is kept at path (and
+    removed with the batch). With resume as well, a batch that was
+    interrupted carries on from the run it was in; if there is nothing at
+    path, or no path, the batch starts from the beginning.
+
+    Returns:
+        int, the number of runs that found a solution
+    """
+    first_run = solutions_found = 0
+    resume = resume and path is not None
+    if resume and os.path.exists(path):
+        first_run, solutions_found = load_batch_progress(path)
+        # The last finished run may have been cut off before its own
+        # checkpoint was removed.
+        stale_path = run_checkpoint_path(path, first_run - 1)
+        if first_run and os.path.exists(stale_path):
+            os.remove(stale_path)
+    for index in range(first_run, runs):
+        run_path = None if path is None else run_checkpoint_path(path, index)
+        if resume and index == first_run and os.path.exists(run_path):
+            solution, attacks = resume_run(index, run_path)
+        else:
+            solution, attacks = start_run(index, run_path)
+        if attacks == 0:
+            solutions_found += 1
+        if on_result is not None:
+            on_result(index, solution, attacks)
+        if path is not None:
+            write_atomically(
+                path, BATCH_PROGRESS.pack(BATCH_MAGIC, index + 1, solutions_found)
+            )
+            if os.path.exists(run_path):
+                os.remove(run_path)
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+    return solutions_found
+
+
+def load_batch_progress(path):
+    """
+    Returns:
+        tuple of the number of runs finished and of solutions found
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) != BATCH_PROGRESS.size:
+        raise ValueError(f"{path} is not an 8-queens batch checkpoint")
+    magic, finished, solutions_found = BATCH_PROGRESS.unpack(data)
+    if magic != BATCH_MAGIC:
+        raise ValueError(f"{path} is not an 8-queens batch checkpoint")
+    return finished, solutions_found
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def add_checkpoint_arguments(parser):
+    group = parser.add_argument_group("checkpointing")
+    group.add_argument(
+        "--checkpoint",
+        metavar="PATH",
+        help="keep the batch's progress at PATH and each run's checkpoints "
+        "at PATH.run<N>",
+    )
+    group.add_argument(
+        "--checkpoint-every",
+        type=positive_int,
+        default=100,
+        metavar="N",
+        help="iterations between checkpoints (default: 100)",
+    )
+    group.add_argument(
+        "--resume",
+        action="store_true",
+        help="carry on with the batch checkpointed at --checkpoint, if any",
+    )
@@ -0,0 +1,438 @@
+import argparse
+import random
+import time
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+
+from ..rng import run_rng
+from ..streaming import Snapshot, run_stream
+from ..telemetry import (
+    add_telemetry_arguments,
+    export_telemetry,
+    instrumented,
+    phase,
+    telemetry_from_arguments,
+)
+from .board import create_board, place_queens, print_board
+from .checkpoint import (
+    GeneticCheckpoint,
+    add_checkpoint_arguments,
+    load_checkpoint,
+    run_batch,
+    save_checkpoint,
+)
+
+
+def optimized_get_attacking_pairs(board):
+    attacking_pairs = 0
+    for i in range(8):
+        for j in range(8):
+            if board[i][j] == 1:
+                # Check row
+                attacking_pairs += sum(board[i]) - 1
+                # Check column
+                attacking_pairs += sum(board[k][j] for k in range(8)) - 1
+                # Check diagonals
+                attacking_pairs += sum(
+                    board[i + k][j + k] == 1
+                    for k in range(1, 8)
+                    if i + k < 8 and j + k < 8
+                )
+                attacking_pairs += sum(
+                    board[i - k][j + k] == 1
+                    for k in range(1, 8)
+                    if i - k >= 0 and j + k < 8
+                )
+                attacking_pairs += sum(
+                    board[i + k][j - k] == 1
+                    for k in range(1, 8)
+                    if i + k < 8 and j - k >= 0
+                )
+                attacking_pairs += sum(
+                    board[i - k][j - k] == 1
+                    for k in range(1, 8)
+                    if i - k >= 0 and j - k >= 0
+                )
+    return attacking_pairs // 2
+
+
+def optimized_fitness(board):
+    return 1 / (1 + optimized_get_attacking_pairs(board))
+
+
+def reproduce(parent1, parent2, rng=None):
+    if rng is None:
+        rng = random
+    crossover_point = rng.randint(0, 7)
+    child = create_board()
+    for i in range(8):
+        if i <= crossover_point:
+            for row in range(8):
+                child[row][i] = parent1[row][i]
+        else:
+            for row in range(8):
+                child[row][i] = parent2[row][i]
+    return child
+
+
+def mutate(board, rng=None):
+    if rng is None:
+        rng = random
+    col = rng.randint(0, 7)
+    for r in range(8):
+        board[r][col] = 0
+    row = rng.randint(0, 7)
+    board[row][col] = 1
+    return board
+
+
+def argsort(values, reverse=False):
+    """
+    Orders the indices of values by value, so that ties never fall back to
+    comparing whatever the values were zipped with.
+
+    Returns:
+        list of int
+    """
+    return sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+
+def roulette_selection(fitness_values, count, rng=None):
+    """
+    Fitness-proportionate selection. The cumulative weights are built once
+    and every parent index is drawn against them in a single batch.
+
+    Returns:
+        list of int
+    """
+    if rng is None:
+        rng = random
+    cum_weights = list(accumulate(fitness_values))
+    return rng.choices(range(len(fitness_values)), cum_weights=cum_weights, k=count)
+
+
+def stochastic_universal_selection(fitness_values, count, rng=None):
+    """
+    Stochastic universal sampling: count evenly spaced pointers with a single
+    random offset are swept across the cumulative weights in one pass, which
+    keeps the spread of picks close to each board's expected share. The
+    sweep yields indices in ascending order, so they are shuffled before
+    being paired up as parents.
+
+    Returns:
+        list of int
+    """
+    if rng is None:
+        rng = random
+    if not count:
+        return []
+    cum_weights = list(accumulate(fitness_values))
+    step = cum_weights[-1] / count
+    pointer = rng.random() * step
+    last = len(cum_weights) - 1
+    indices = []
+    index = 0
+    for _ in range(count):
+        while index < last and cum_weights[index] <= pointer:
+            index += 1
+        indices.append(index)
+        pointer += step
+    rng.shuffle(indices)
+    return indices
+
+
+def tournament_selection(fitness_values, count, tournament_size=3, rng=None):
+    """
+    Picks each parent as the fittest of tournament_size boards drawn at
+    random. No cumulative weights are needed at all.
+
+    Returns:
+        list of int
+    """
+    if rng is None:
+        rng = random
+    n = len(fitness_values)
+    score = fitness_values.__getitem__
+    return [
+        max(rng.choices(range(n), k=tournament_size), key=score)
+        for _ in range(count)
+    ]
+
+
+def rank_selection(fitness_values, count, rng=None):
+    """
+    Linear rank selection: the fittest of n boards gets weight n and the
+    least fit weight 1, so selection pressure does not depend on how far
+    apart the fitness values are.
+
+    Returns:
+        list of int
+    """
+    if rng is None:
+        rng = random
+    n = len(fitness_values)
+    order = argsort(fitness_values, reverse=True)
+    cum_weights = list(accumulate(range(n, 0, -1)))
+    total = cum_weights[-1]
+    return [
+        order[bisect_left(cum_weights, rng.random() * total)]
+        for _ in range(count)
+    ]
+
+
+SELECTION_METHODS = {
+    "roulette": roulette_selection,
+    "sus": stochastic_universal_selection,
+    "tournament": tournament_selection,
+    "rank": rank_selection,
+}
+
+
+@instrumented
+def optimized_genetic_algorithm(
+    population_size=50,
+    mutation_rate=0.05,
+    max_generations=500,
+    selection="roulette",
+    telemetry=None,
+    checkpoint_path=None,
+    checkpoint_every=100,
+    rng=None,
+):
+    """
+    Evolves a random population for up to max_generations generations,
+    drawing from rng (the random module if None; see comp469.rng). With
+    checkpoint_path set, the population is checkpointed there every
+    checkpoint_every generations; see resume_genetic_algorithm.
+
+    Returns:
+        tuple of the fittest board and its attacking pairs
+    """
+    stream = genetic_algorithm_stream(
+        population_size,
+        mutation_rate,
+        max_generations,
+        selection,
+        telemetry,
+        checkpoint_path,
+        checkpoint_every,
+        rng,
+    )
+    return run_stream(stream)[0]
+
+
+def genetic_algorithm_stream(
+    population_size=50,
+    mutation_rate=0.05,
+    max_generations=500,
+    selection="roulette",
+    telemetry=None,
+    checkpoint_path=None,
+    checkpoint_every=100,
+    rng=None,
+):
+    """
+    optimized_genetic_algorithm as a generator: yields a Snapshot of the
+    fittest board after every generation and returns the same (board,
+    attacks) pair. max_generations may be None for no limit. A budget sent
+    in counts generations; see comp469.streaming.
+    """
+    if rng is None:
+        rng = random
+    population = [place_queens(create_board(), rng) for _ in range(population_size)]
+    return evolve(
+        population,
+        0,
+        max_generations,
+        mutation_rate,
+        selection,
+        telemetry,
+        checkpoint_path,
+        checkpoint_every,
+        rng,
+    )
+
+
+@instrumented
+def resume_genetic_algorithm(path, telemetry=None, checkpoint_every=100, rng=None):
+    """
+    Continues the run checkpointed at path, restoring rng (the random
+    module if None) to its state at the checkpoint, so the result is the
+    one the original run would have returned. Further checkpoints go to the
+    same path.
+
+    Returns:
+        tuple of the fittest board and its attacking pairs
+    """
+    checkpoint = load_checkpoint(path)
+    if not isinstance(checkpoint, GeneticCheckpoint):
+        raise ValueError(f"{path} is not a genetic algorithm checkpoint")
+    if rng is None:
+        rng = random
+    rng.setstate(checkpoint.rng_state)
+    stream = evolve(
+        checkpoint.population,
+        checkpoint.generation,
+        checkpoint.max_generations,
+        checkpoint.mutation_rate,
+        checkpoint.selection,
+        telemetry,
+        path,
+        checkpoint_every,
+        rng,
+    )
+    return run_stream(stream)[0]
+
+
+def evolve(
+    population,
+    generation,
+    max_generations,
+    mutation_rate,
+    selection,
+    telemetry,
+    checkpoint_path,
+    checkpoint_every,
+    rng,
+):
+    if checkpoint_path is not None and checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+    select = SELECTION_METHODS[selection]
+    population_size = len(population)
+    first_generation = generation
+    while max_generations is None or generation < max_generations:
+        if (
+            checkpoint_path is not None
+            and generation != first_generation
+            and not generation % checkpoint_every
+        ):
+            save_checkpoint(
+                checkpoint_path,
+                GeneticCheckpoint(
+                    generation,
+                    max_generations,
+                    mutation_rate,
+                    selection,
+                    population,
+                    rng.getstate(),
+                ),
+            )
+        with phase(telemetry, "fitness"):
+            with ThreadPoolExecutor() as executor:
+                fitness_values = list(executor.map(optimized_fitness, population))
+            order = argsort(fitness_values, reverse=True)
+            population = [population[i] for i in order]
+            fitness_values = [fitness_values[i] for i in order]
+        if telemetry is not None:
+            telemetry.count("generations")
+            telemetry.count("evaluations", len(population))
+            telemetry.sample(generation, best_fitness=fitness_values[0])
+        if fitness_values[0] == 1:
+            return population[0], 0
+        new_population = population[:2]
+        with phase(telemetry, "selection"):
+            parents = select(
+                fitness_values, 2 * (population_size - len(new_population)), rng=rng
+            )
+        with phase(telemetry, "reproduction"):
+            for i in range(0, len(parents), 2):
+                child = reproduce(
+                    population[parents[i]], population[parents[i + 1]], rng
+                )
+                if rng.random() < mutation_rate:
+                    child = mutate(child, rng)
+                new_population.append(child)
+        population = new_population
+        generation += 1
+        best_attacks = round(1 / fitness_values[0] - 1)
+        budget = yield Snapshot(generation, best_attacks, population[0])
+        if budget is not None:
+            max_generations = generation + budget
+    return population[0], optimized_get_attacking_pairs(population[0])
+
+
+# Measure the performance of the optimized genetic algorithm
+
+
+def measureperformance_genetic_algorithm(
+    runs=10,
+    seed=None,
+    checkpoint_path=None,
+    checkpoint_every=100,
+    resume=False,
+    **options,
+):
+    def run_rng_for(run):
+        return None if seed is None else run_rng(seed, run)
+
+    def start_run(run, run_path):
+        return optimized_genetic_algorithm(
+            rng=run_rng_for(run),
+            checkpoint_path=run_path,
+            checkpoint_every=checkpoint_every,
+            **options,
+        )
+
+    def resume_run(run, run_path):
+        return resume_genetic_algorithm(
+            run_path,
+            telemetry=options.get("telemetry"),
+            checkpoint_every=checkpoint_every,
+            rng=run_rng_for(run),
+        )
+
+    def report(run, solution, attacks):
+        if attacks == 0:
+            print(f"Found solution on run {run}")
+            print(f"Num attacks:{attacks}")
+            print_board(solution)
+
+    start_time = time.time()
+    solutions_found = run_batch(
+        start_run, resume_run, runs, checkpoint_path, resume, report
+    )
+    end_time = time.time()
+    elapsed_time = end_time - start_time
+    success_rate = solutions_found / runs
+    return elapsed_time, success_rate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="comp469 genetic",
+        description="Solve 8-queens with the optimized genetic algorithm.",
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--population-size", type=int, default=50)
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed each run's own random stream from SEED, so runs can be replayed",
+    )
+    parser.add_argument(
+        "--selection", choices=sorted(SELECTION_METHODS), default="roulette"
+    )
+    add_telemetry_arguments(parser)
+    add_checkpoint_arguments(parser)
+    args = parser.parse_args(argv)
+    if args.resume and args.checkpoint is None:
+        parser.error("--resume needs --checkpoint")
+
+    telemetry = telemetry_from_arguments(
+        args, "genetic_algorithm", selection=args.selection
+    )
+    elapsed_time, success_rate = measureperformance_genetic_algorithm(
+        args.runs,
+        args.seed,
+        population_size=args.population_size,
+        selection=args.selection,
+        telemetry=telemetry,
+        checkpoint_path=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        resume=args.resume,
+    )
+    export_telemetry(args, [telemetry])
+
+    print(f"Optimized Genetic Algorithm Performance: Time = {elapsed_time:.2f}s")
+    print(f"Solution Board: {success_rate}")
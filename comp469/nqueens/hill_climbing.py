@@ -0,0 +1,114 @@
+import argparse
+import time
+
+from ..rng import run_rng
+from ..streaming import Snapshot, run_stream
+from ..telemetry import (
+    add_telemetry_arguments,
+    export_telemetry,
+    instrumented,
+    telemetry_from_arguments,
+)
+from .board import create_board, get_attacking_pairs, place_queens, print_board
+
+
+def get_neighbors(board):
+    neighbors = []
+    for col in range(8):
+        for row in range(8):
+            if board[row][col] == 0:
+                new_board = [r[:] for r in board]
+                for r in range(8):
+                    new_board[r][col] = 0
+                new_board[row][col] = 1
+                neighbors.append(new_board)
+    return neighbors
+
+
+@instrumented
+def hill_climb(board, telemetry=None):
+    return run_stream(hill_climb_stream(board, telemetry=telemetry))[0]
+
+
+def hill_climb_stream(board, max_steps=None, telemetry=None):
+    """
+    hill_climb as a generator: yields a Snapshot after every move and returns
+    the same (board, attacks) pair. max_steps, if set, bounds the number of
+    moves; see comp469.streaming for stopping, pausing and sending a new
+    budget.
+    """
+    current_board = board
+    current_attacks = get_attacking_pairs(current_board)
+    step = 0
+    while max_steps is None or step < max_steps:
+        neighbors = get_neighbors(current_board)
+        if telemetry is not None:
+            telemetry.count("evaluations", len(neighbors))
+        next_board = None
+        next_attacks = current_attacks
+        for neighbor in neighbors:
+            attacks = get_attacking_pairs(neighbor)
+            if attacks < next_attacks:
+                next_board = neighbor
+                next_attacks = attacks
+        if next_attacks >= current_attacks:
+            break
+        current_board = next_board
+        current_attacks = next_attacks
+        step += 1
+        if telemetry is not None:
+            telemetry.count("accepted_moves")
+            telemetry.sample(step, cost=current_attacks)
+        budget = yield Snapshot(step, current_attacks, current_board)
+        if budget is not None:
+            max_steps = step + budget
+    return current_board, current_attacks
+
+
+def measure_performance_hill_climb(runs=100, telemetry=None, seed=None):
+    start_time = time.time()
+    solutions_found = 0
+    for run in range(runs):
+        rng = None if seed is None else run_rng(seed, run)
+        initial_board = place_queens(create_board(), rng)
+        solution, attacks = hill_climb(initial_board, telemetry=telemetry)
+        if attacks == 0:
+            solutions_found += 1
+    end_time = time.time()
+    elapsed_time = end_time - start_time
+    success_rate = solutions_found / runs
+    return elapsed_time, success_rate
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="comp469 hill-climb", description="Solve 8-queens by hill climbing."
+    )
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="seed each run's own random stream from SEED, so runs can be replayed",
+    )
+    add_telemetry_arguments(parser)
+    args = parser.parse_args(argv)
+
+    telemetry = telemetry_from_arguments(args, "hill_climb")
+    elapsed_time, success_rate = measure_performance_hill_climb(
+        args.runs, telemetry, args.seed
+    )
+    export_telemetry(args, [telemetry])
+    print(
+        f"Hill-Climbing Performance: Time = {elapsed_time:.2f}s, "
+        f"Success Rate = {success_rate:.2%}"
+    )
+    # The example gets the stream after the batch's, so it can be replayed too.
+    example_rng = None if args.seed is None else run_rng(args.seed, args.runs)
+    initial_board = place_queens(create_board(), example_rng)
+    solution, attacks = hill_climb(initial_board)
+
+    print("Initial Board:")
+    print_board(initial_board)
+    print("Solution Board:")
+    print_board(solution)
+    print(f"Attacking Pairs: {attacks}")
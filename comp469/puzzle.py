@@ -0,0 +1,427 @@
+import argparse
+import heapq
+from collections import deque
+
+from .streaming import Snapshot, run_stream
+from .telemetry import (
+    add_telemetry_arguments,
+    export_telemetry,
+    instrumented,
+    telemetry_from_arguments,
+)
+
+
+def heuristic (state,goal):
+        """
+        Heuristic function for A* algorithm. Computes the Manhattan distance between the current state and the goal state.
+        """
+        return sum(abs(b % 3 - g % 3) + abs(b // 3 - g // 3)
+                    for b, g in ((state.index(i), goal.index(i)) for i in range(1, 9)))
+
+class PuzzleGraph:
+    def __init__(self, initial_state, goal_state):
+        self.initial_state = tuple(initial_state)
+        self.goal_state = tuple(goal_state)
+        self._graph = None
+        self._state_space = None
+
+    @property
+    def graph(self):
+        """
+        The networkx DiGraph of every state reachable from the initial state.
+        It is only built, and networkx only imported, on first access; the
+        searches below do not need it. For whole-space analysis state_space
+        is far smaller and faster.
+        """
+        if self._graph is None:
+            self.build_graph()
+        return self._graph
+
+    @property
+    def state_space(self):
+        """
+        The CSR graph of every 8-puzzle state (comp469.statespace), built on
+        first access. Requires numpy.
+        """
+        if self._state_space is None:
+            from .statespace import build_state_space
+
+            self._state_space = build_state_space()
+        return self._state_space
+
+    def build_graph(self):
+        """
+        Builds the graph for the puzzle. Each state of the puzzle is a node, and each valid move between states is an edge.
+        """
+        import networkx as nx
+
+        self._graph = nx.DiGraph()
+        queue = deque([self.initial_state])
+        visited = set()
+        while queue:
+            state = queue.popleft()
+            if state in visited:
+                continue
+            visited.add(state)
+            self._graph.add_node(state)
+            for neighbor in self.get_neighbors(state):
+                if neighbor not in visited:
+                    queue.append(neighbor)
+                self._graph.add_edge(state, neighbor)
+
+    def get_neighbors(self, state):
+        """
+        Returns the neighboring states of the given state by moving the empty space in the puzzle.
+        """
+        neighbors = []
+        empty_index = state.index(0)
+        row, col = divmod(empty_index, 3)
+        moves = {'up': -3, 'down': 3, 'left': -1, 'right': 1}
+        for move, pos_change in moves.items():
+            new_index = empty_index + pos_change
+            if move == 'up' and row == 0 or move == 'down' and row == 2 or move == 'left' and col == 0 or move == 'right' and col == 2:
+                continue
+            new_state = list(state)
+            new_state[empty_index], new_state[new_index] = new_state[new_index], new_state[empty_index]
+            neighbors.append(tuple(new_state))
+       
+        return neighbors
+
+    @instrumented
+    def bfs(self, telemetry=None):
+        """
+        Breadth-First Search (BFS) to find the shortest path to the goal state.
+        """
+        stream = self.bfs_stream(telemetry=telemetry, snapshots=False)
+        return run_stream(stream)[0]
+
+    def bfs_stream(self, max_expansions=None, telemetry=None, snapshots=True):
+        """
+        bfs as a generator; see search_stream.
+        """
+        queue = deque([(self.initial_state, [])])
+        visited = set()
+        best_cost = heuristic(self.initial_state, self.goal_state)
+        best_state = self.initial_state
+
+        while queue and (max_expansions is None or len(visited) < max_expansions):
+            current_state, path = queue.popleft()
+            if current_state == self.goal_state:
+                return path + [current_state]
+
+            if current_state in visited:
+                continue
+
+            visited.add(current_state)
+            if telemetry is not None:
+                telemetry.count("expansions")
+                telemetry.sample(len(visited), frontier=len(queue))
+            if snapshots:
+                cost = heuristic(current_state, self.goal_state)
+                if cost < best_cost:
+                    best_cost, best_state = cost, current_state
+
+            neighbors = self.get_neighbors(current_state)
+            if neighbors is None:
+                print(f"Error: get_neighbors returned None for state {current_state}")  # Debugging statement
+                continue
+
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    queue.append((neighbor, path + [current_state]))
+
+            if snapshots:
+                budget = yield Snapshot(len(visited), best_cost, best_state)
+                if budget is not None:
+                    max_expansions = len(visited) + budget
+
+        return None
+    
+    @instrumented
+    def dfs(self, telemetry=None):
+        """
+        Depth-First Search (DFS) to find a path to the goal state.
+        """
+        stream = self.dfs_stream(telemetry=telemetry, snapshots=False)
+        return run_stream(stream)[0]
+
+    def dfs_stream(self, max_expansions=None, telemetry=None, snapshots=True):
+        """
+        dfs as a generator; see search_stream.
+        """
+        stack = [(self.initial_state,[])]
+        visited = set()
+        best_cost = heuristic(self.initial_state, self.goal_state)
+        best_state = self.initial_state
+        
+        while stack and (max_expansions is None or len(visited) < max_expansions):
+            current_state , path = stack.pop()
+            if current_state == self.goal_state:
+                return path + [current_state]
+            if current_state in visited:
+                continue
+            
+            visited.add(current_state)
+            if telemetry is not None:
+                telemetry.count("expansions")
+                telemetry.sample(len(visited), frontier=len(stack))
+            if snapshots:
+                cost = heuristic(current_state, self.goal_state)
+                if cost < best_cost:
+                    best_cost, best_state = cost, current_state
+
+            neighbors = self.get_neighbors(current_state)
+            if neighbors is None:
+               print(f"Error: get_neighbors returned None for state {current_state}")  # Debugging statement
+               continue
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    stack.append((neighbor,path+[current_state]))
+
+            if snapshots:
+                budget = yield Snapshot(len(visited), best_cost, best_state)
+                if budget is not None:
+                    max_expansions = len(visited) + budget
+        return None
+
+    
+
+    @instrumented
+    def a_star(self, telemetry=None):
+        """
+        A* Search to find the optimal path to the goal state.
+        """
+        stream = self.a_star_stream(telemetry=telemetry, snapshots=False)
+        return run_stream(stream)[0]
+
+    def a_star_stream(self, max_expansions=None, telemetry=None, snapshots=True):
+        """
+        a_star as a generator; see search_stream.
+        """
+        heap = [(heuristic(self.initial_state, self.goal_state), 0, self.initial_state, [])]
+        visited = set()
+        best_cost = heap[0][0]
+        best_state = self.initial_state
+
+        while heap and (max_expansions is None or len(visited) < max_expansions):
+            h, cost , current_state , path  = heapq.heappop(heap)
+            if current_state == self.goal_state:
+                return path + [current_state]
+            if current_state in visited:
+                continue
+            visited.add(current_state)
+            if telemetry is not None:
+                telemetry.count("expansions")
+                telemetry.sample(len(visited), frontier=len(heap), cost=cost)
+            # h is f = g + h here; the distance to the goal is what is left.
+            if snapshots and h - cost < best_cost:
+                best_cost, best_state = h - cost, current_state
+
+            neighbors = self.get_neighbors(current_state)
+
+            if neighbors is None:
+                print(f"Error: get_neighbors returned None for state {current_state}")  # Debugging statement
+                continue
+            for neighbor in neighbors:
+                if neighbor not in visited: 
+                    heapq.heappush(heap, (heuristic(neighbor, self.goal_state) + cost + 1, cost + 1, neighbor, path + [current_state]))
+
+            if snapshots:
+                budget = yield Snapshot(len(visited), best_cost, best_state)
+                if budget is not None:
+                    max_expansions = len(visited) + budget
+        return None
+    
+    @instrumented
+    def greedy_best_first(self, telemetry=None):
+        """
+        Greedy Best-First Search to find a path to the goal state.
+        """
+        stream = self.greedy_best_first_stream(telemetry=telemetry, snapshots=False)
+        return run_stream(stream)[0]
+
+    def greedy_best_first_stream(self, max_expansions=None, telemetry=None, snapshots=True):
+        """
+        greedy_best_first as a generator; see search_stream.
+        """
+        heap = [(heuristic(self.initial_state, self.goal_state), self.initial_state, [])]
+        visited = set()
+        best_cost = heap[0][0]
+        best_state = self.initial_state
+
+        while heap and (max_expansions is None or len(visited) < max_expansions):
+            h, current_state,path = heapq.heappop(heap)
+            if current_state == self.goal_state:
+                return path + [current_state]
+            if current_state in visited:
+                continue
+            visited.add(current_state)
+            if telemetry is not None:
+                telemetry.count("expansions")
+                telemetry.sample(len(visited), frontier=len(heap), cost=h)
+            if snapshots and h < best_cost:
+                best_cost, best_state = h, current_state
+
+            neighbors= self.get_neighbors(current_state)
+            if neighbors is None:
+                print(f"Error: get_neighbors returned None for state {current_state}")  # Debugging statement
+                continue
+
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    heapq.heappush(heap, (heuristic(neighbor, self.goal_state), neighbor, path + [current_state]))
+
+            if snapshots:
+                budget = yield Snapshot(len(visited), best_cost, best_state)
+                if budget is not None:
+                    max_expansions = len(visited) + budget
+
+        return None
+    @instrumented
+    def ids(self, telemetry=None):
+        """
+        Iterative Deepening Search (IDS) to find a path to the goal state.
+        """
+        return run_stream(self.ids_stream(telemetry=telemetry, snapshots=False))[0]
+
+    def ids_stream(self, max_depth=None, telemetry=None, snapshots=True):
+        """
+        ids as a generator; see search_stream. Its iterations, and so its
+        budget, are whole depths rather than expansions.
+        """
+        best_cost = heuristic(self.initial_state, self.goal_state)
+        best_state = self.initial_state
+
+        def dls(state, path, depth):
+            nonlocal best_cost, best_state
+            if snapshots:
+                cost = heuristic(state, self.goal_state)
+                if cost < best_cost:
+                    best_cost, best_state = cost, state
+            if depth == 0:
+                if state == self.goal_state:
+                    return path + [state]
+                return None
+            if depth > 0:
+                if telemetry is not None:
+                    telemetry.count("expansions")
+                for neighbor in self.get_neighbors(state):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        result = dls(neighbor, path + [state], depth - 1)
+                        if result:
+                            return result
+                        visited.remove(neighbor)
+            return None
+
+        depth = 0
+        while max_depth is None or depth < max_depth:
+            visited = set()
+            result = dls(self.initial_state, [], depth)
+            if result:
+                return result
+            depth += 1
+            if telemetry is not None:
+                telemetry.count("iterations")
+                telemetry.sample(depth, depth=depth)
+            if snapshots:
+                budget = yield Snapshot(depth, best_cost, best_state)
+                if budget is not None:
+                    max_depth = depth + budget
+        return None
+
+    def search_stream(self, algorithm="a_star", max_expansions=None, telemetry=None):
+        """
+        Runs one of the searches above (a key of ALGORITHMS) as a generator.
+        It yields a Snapshot after every state it expands, carrying the
+        expanded state closest to the goal by Manhattan distance, and returns
+        the same path as the blocking method (None if the budget runs out
+        first). For ids an iteration is one whole depth rather than one
+        expansion. See comp469.streaming for stopping, pausing and sending a
+        new budget.
+
+        Each X_stream method also takes snapshots=False, which runs it
+        without tracking the closest state or yielding at all; the blocking
+        methods use it so they pay nothing for the streaming.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"unknown search {algorithm!r}")
+        stream = getattr(self, f"{algorithm}_stream")
+        return stream(max_expansions, telemetry)
+
+    def measure_performance(self, search_algorithm, telemetry=None):
+        import time
+        start_time = time.time()
+        solution_path = search_algorithm(telemetry=telemetry)
+        end_time = time.time()
+        if solution_path:
+            print(f"Solution found in {len(solution_path) - 1} moves")
+            print(f"Time taken: {end_time - start_time} seconds")
+            print("Solution Path:")
+            for state in solution_path:
+                for i in range(0, len(state), 3):
+                    print(state[i:i+3])
+                print()
+        else:
+            print("No solution found")
+
+
+# Example initial and goal states
+INITIAL_STATE = [1, 2, 3, 4, 5, 6, 7, 0, 8]
+GOAL_STATE = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+
+ALGORITHMS = {
+    "bfs": "BFS",
+    "dfs": "DFS",
+    "a_star": "A*",
+    "greedy_best_first": "Greedy Best-First",
+    "ids": "Iterative Deepening Search",
+}
+
+
+def analyze_state_space(puzzle_graph):
+    from .statespace import diameter, rank_state
+
+    state_space = puzzle_graph.state_space
+    histogram = state_space.distance_histogram(rank_state(puzzle_graph.initial_state))
+    print(
+        f"State space: {state_space.num_states} states, {state_space.num_edges} "
+        f"moves, {state_space.nbytes / 1e6:.1f} MB"
+    )
+    print(f"Reachable from the initial state: {histogram.sum()}")
+    print(f"Diameter: {diameter(state_space, puzzle_graph.initial_state)}")
+    print(f"States at each distance: {histogram.tolist()}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="comp469 puzzle", description="Solve the 8-puzzle with each search."
+    )
+    parser.add_argument(
+        "algorithms",
+        nargs="*",
+        metavar="ALGORITHM",
+        help=f"searches to run, from {', '.join(ALGORITHMS)} (all by default)",
+    )
+    parser.add_argument(
+        "--analyze",
+        action="store_true",
+        help="also report the size and diameter of the whole state space (needs numpy)",
+    )
+    add_telemetry_arguments(parser)
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.algorithms if name not in ALGORITHMS]
+    if unknown:
+        parser.error(f"unknown algorithm(s): {', '.join(unknown)}")
+    algorithms = args.algorithms or list(ALGORITHMS)
+
+    puzzle_graph = PuzzleGraph(INITIAL_STATE, GOAL_STATE)
+    if args.analyze:
+        analyze_state_space(puzzle_graph)
+    telemetries = []
+    for algorithm in algorithms:
+        print(f"{ALGORITHMS[algorithm]} Performance:")
+        telemetry = telemetry_from_arguments(args, f"puzzle_{algorithm}")
+        puzzle_graph.measure_performance(getattr(puzzle_graph, algorithm), telemetry)
+        telemetries.append(telemetry)
+    export_telemetry(args, telemetries)
@@ -0,0 +1,38 @@
+"""
+Random number streams for the stochastic solvers.
+
+Every 8-queens function that draws random numbers takes rng=None: any
+object with the random.Random interface. Left as None it draws from the
+random module's global generator, as it always has. Passing a generator of
+its own makes a run independent of everything else in the process, and
+replayable from the generator's seed.
+
+For many runs or workers, run_rng(seed, i) is the stream of run i: one of
+numpy's SeedSequence children of seed, so streams never overlap and each
+can be recreated on its own without drawing the ones before it.
+"""
+import random
+
+
+def run_rng(seed, index):
+    """
+    The generator of run index out of a batch seeded with seed. Equal to
+    the index-th stream of SeedSequence(seed).spawn(...). Requires numpy.
+
+    Returns:
+        random.Random
+    """
+    from numpy.random import SeedSequence
+
+    words = SeedSequence(seed, spawn_key=(index,)).generate_state(4)
+    return random.Random(sum(int(word) << (32 * i) for i, word in enumerate(words)))
+
+
+def spawn_rngs(seed, count):
+    """
+    Independent generators for count runs or workers; see run_rng.
+
+    Returns:
+        list of random.Random
+    """
+    return [run_rng(seed, index) for index in range(count)]
@@ -0,0 +1,264 @@
+"""
+The whole 8-puzzle state space as a compact CSR graph.
+
+States are identified by their rank, the index of the tile permutation in
+lexicographic order, so the 9! states need no lookup table. The graph is
+two arrays: neighbors holds the successors of every state back to back,
+in the order PuzzleGraph.get_neighbors lists them, and those of state i
+are neighbors[offsets[i]:offsets[i + 1]]. Both are plain numpy arrays, a
+few MB in all, that save with numpy.save and load memory-mapped.
+
+Requires numpy; networkx is only needed for to_networkx.
+"""
+import math
+import os
+from itertools import permutations
+
+import numpy as np
+
+SIDE = 3
+CELLS = SIDE * SIDE
+# Blank moves in PuzzleGraph.get_neighbors order: up, down, left, right.
+MOVES = (-SIDE, SIDE, -1, 1)
+
+
+def rank_state(state):
+    """
+    Lexicographic rank of a permutation of range(n).
+
+    Returns:
+        int
+    """
+    n = len(state)
+    rank = 0
+    for i, tile in enumerate(state):
+        smaller = sum(other < tile for other in state[i + 1 :])
+        rank += smaller * math.factorial(n - 1 - i)
+    return rank
+
+
+def unrank_state(rank, n=CELLS):
+    """
+    The permutation of range(n) whose lexicographic rank is rank.
+
+    Returns:
+        tuple of int
+    """
+    tiles = list(range(n))
+    state = []
+    for i in range(n - 1, -1, -1):
+        index, rank = divmod(rank, math.factorial(i))
+        state.append(tiles.pop(index))
+    return tuple(state)
+
+
+def rank_states(states):
+    """
+    rank_state over the rows of a 2-D array of permutations at once.
+
+    Returns:
+        numpy array of int64
+    """
+    n = states.shape[1]
+    ranks = np.zeros(len(states), dtype=np.int64)
+    for i in range(n - 1):
+        smaller = (states[:, i + 1 :] < states[:, i : i + 1]).sum(axis=1)
+        ranks += smaller * math.factorial(n - 1 - i)
+    return ranks
+
+
+def move_blank(state, target):
+    """
+    Slides the blank of state to square target, row first, which keeps the
+    result in the same connected half of the state space.
+
+    Returns:
+        tuple of int
+    """
+    state = list(state)
+    blank = state.index(0)
+    while blank != target:
+        if target // SIDE != blank // SIDE:
+            step = SIDE if target > blank else -SIDE
+        else:
+            step = 1 if target > blank else -1
+        state[blank], state[blank + step] = state[blank + step], 0
+        blank += step
+    return tuple(state)
+
+
+class StateSpace:
+    """
+    CSR adjacency over ranked state ids: offsets has one entry per state
+    plus one, neighbors one per directed edge.
+    """
+
+    def __init__(self, offsets, neighbors):
+        self.offsets = offsets
+        self.neighbors = neighbors
+
+    @property
+    def num_states(self):
+        return len(self.offsets) - 1
+
+    @property
+    def num_edges(self):
+        return len(self.neighbors)
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.neighbors.nbytes
+
+    def successors(self, state_id):
+        return self.neighbors[self.offsets[state_id] : self.offsets[state_id + 1]]
+
+    def save(self, directory):
+        """
+        Writes offsets.npy and neighbors.npy to directory, creating it if
+        needed.
+        """
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, "offsets.npy"), self.offsets)
+        np.save(os.path.join(directory, "neighbors.npy"), self.neighbors)
+
+    @classmethod
+    def load(cls, directory, mmap=True):
+        """
+        Reads a state space written by save. With mmap the arrays are mapped
+        read-only rather than read in, so loading costs nothing up front.
+
+        Returns:
+            StateSpace
+        """
+        mmap_mode = "r" if mmap else None
+        return cls(
+            np.load(os.path.join(directory, "offsets.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(directory, "neighbors.npy"), mmap_mode=mmap_mode),
+        )
+
+    def bfs(self, source):
+        """
+        Breadth-first search from source, one whole frontier per numpy step:
+        the successors of every frontier state are gathered in one go and
+        the unseen ones become the next frontier.
+
+        Returns:
+            numpy array of the distance of every state from source, -1 for
+            states it cannot reach
+        """
+        offsets = np.asarray(self.offsets)
+        neighbors = np.asarray(self.neighbors)
+        distances = np.full(self.num_states, -1, dtype=np.int32)
+        distances[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        depth = 0
+        while frontier.size:
+            starts = offsets[frontier]
+            counts = offsets[frontier + 1] - starts
+            ends = np.cumsum(counts)
+            edges = np.repeat(starts - ends + counts, counts) + np.arange(ends[-1])
+            reached = neighbors[edges]
+            frontier = np.unique(reached[distances[reached] < 0])
+            depth += 1
+            distances[frontier] = depth
+        return distances
+
+    def distance_histogram(self, source):
+        """
+        Returns:
+            numpy array, the number of states at each distance from source
+        """
+        distances = self.bfs(source)
+        return np.bincount(distances[distances >= 0])
+
+    def eccentricity(self, source):
+        return int(self.bfs(source).max())
+
+    def components(self):
+        """
+        Labels each state with the index of its connected component. Every
+        move can be undone, so these are also the strongly connected ones.
+
+        Returns:
+            numpy array of int32, and the number of components
+        """
+        labels = np.full(self.num_states, -1, dtype=np.int32)
+        count = 0
+        unlabeled = 0
+        while True:
+            remaining = np.flatnonzero(labels[unlabeled:] < 0)
+            if not remaining.size:
+                return labels, count
+            unlabeled += int(remaining[0])
+            labels[self.bfs(unlabeled) >= 0] = count
+            count += 1
+
+    def to_networkx(self, source=None):
+        """
+        Exports the graph as a networkx DiGraph with state tuples as nodes,
+        like PuzzleGraph.graph. With source given, only the states it can
+        reach are included.
+
+        Returns:
+            networkx.DiGraph
+        """
+        import networkx as nx
+
+        if source is None:
+            state_ids = range(self.num_states)
+        else:
+            state_ids = np.flatnonzero(self.bfs(source) >= 0).tolist()
+        states = {state_id: unrank_state(state_id) for state_id in state_ids}
+        graph = nx.DiGraph()
+        graph.add_nodes_from(states.values())
+        for state_id, state in states.items():
+            for neighbor in self.successors(state_id).tolist():
+                graph.add_edge(state, states[neighbor])
+        return graph
+
+
+def build_state_space():
+    """
+    Builds the CSR graph over all 9! tile arrangements. Every state is a
+    row of one array, so each blank move is applied to all of them at once.
+
+    Returns:
+        StateSpace
+    """
+    states = np.array(list(permutations(range(CELLS))), dtype=np.int8)
+    blanks = np.argmax(states == 0, axis=1)
+    rows, cols = np.divmod(blanks, SIDE)
+    valid_moves = (rows > 0, rows < SIDE - 1, cols > 0, cols < SIDE - 1)
+    sources = []
+    targets = []
+    for move, valid in zip(MOVES, valid_moves):
+        state_ids = np.flatnonzero(valid)
+        moved = states[state_ids]
+        blank = blanks[state_ids]
+        index = np.arange(len(state_ids))
+        moved[index, blank] = moved[index, blank + move]
+        moved[index, blank + move] = 0
+        sources.append(state_ids)
+        targets.append(rank_states(moved))
+    sources = np.concatenate(sources)
+    order = np.argsort(sources, kind="stable")
+    offsets = np.zeros(len(states) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=len(states)), out=offsets[1:])
+    neighbors = np.concatenate(targets)[order].astype(np.int32)
+    return StateSpace(offsets, neighbors)
+
+
+def diameter(state_space, state):
+    """
+    The diameter of the component of state. Relabelling the tiles maps the
+    graph onto itself without moving the blank, so a state's eccentricity
+    depends only on where its blank is, and one BFS per blank square
+    suffices.
+
+    Returns:
+        int
+    """
+    return max(
+        state_space.eccentricity(rank_state(move_blank(state, square)))
+        for square in range(CELLS)
+    )
@@ -0,0 +1,62 @@
+"""
+Progress snapshots for the generator variants of the solvers.
+
+Each *_stream solver is a generator that yields a Snapshot after every
+iteration and returns the same result as its blocking counterpart. The
+caller stays in control:
+
+- stop: close the generator, or just stop iterating it
+- pause: stop calling next(); all state stays in the suspended generator
+- new budget: stream.send(n) allows n more iterations from the current one,
+  replacing whatever budget was left. The snapshot yielded when the budget
+  runs out is the last chance to do so; resuming without sending ends the
+  run.
+"""
+from collections import namedtuple
+
+Snapshot = namedtuple("Snapshot", ["iteration", "best_cost", "best_board"])
+Snapshot.__doc__ = """
+Progress of a streaming solver after iteration iterations: the lowest cost
+seen so far (attacking pairs, or Manhattan distance to the goal for the
+8-puzzle) and the board or state that has it.
+"""
+
+
+def run_stream(stream, should_stop=None):
+    """
+    Runs stream to the end, or until should_stop(snapshot) returns True, in
+    which case the stream is closed. Returns the stream's own result (None
+    if it was stopped) and the last snapshot it yielded.
+
+    Returns:
+        tuple
+    """
+    snapshot = None
+    while True:
+        try:
+            snapshot = next(stream)
+        except StopIteration as stop:
+            return stop.value, snapshot
+        if should_stop is not None and should_stop(snapshot):
+            stream.close()
+            return None, snapshot
+
+
+def stalled(patience):
+    """
+    A should_stop for run_stream that stops once the best cost has not
+    improved for patience snapshots in a row.
+    """
+    best_cost = None
+    since_improvement = 0
+
+    def should_stop(snapshot):
+        nonlocal best_cost, since_improvement
+        if best_cost is None or snapshot.best_cost < best_cost:
+            best_cost = snapshot.best_cost
+            since_improvement = 0
+        else:
+            since_improvement += 1
+        return since_improvement >= patience
+
+    return should_stop
@@ -0,0 +1,306 @@
+"""
+Opt-in instrumentation shared by the solvers.
+
+Every solver takes telemetry=None. Left as None nothing is recorded and the
+solver pays one `is not None` test per iteration at most. Passing a
+Telemetry collects per-phase timers, event counters, a sampling callback
+every sample_every iterations and, if asked for, a cProfile or tracemalloc
+capture of the run. write_json_lines and write_prometheus export the
+results.
+"""
+import contextlib
+import functools
+import json
+import os
+import time
+
+
+class Telemetry:
+    """
+    Timers and counters for one solver. The same object may be passed to
+    many runs (as the measure_performance helpers do); counters, timers and
+    elapsed time then add up across them and runs counts how many there
+    were.
+
+    on_sample, if given, is called as on_sample(telemetry, iteration, state)
+    on every sample_every-th iteration, with state a dict of whatever the
+    solver reports (best cost, temperature, frontier size, ...).
+    """
+
+    def __init__(
+        self,
+        solver,
+        sample_every=0,
+        on_sample=None,
+        profile=False,
+        trace_memory=False,
+        labels=None,
+    ):
+        self.solver = solver
+        self.sample_every = sample_every
+        self.on_sample = on_sample
+        self.profile = profile
+        self.trace_memory = trace_memory
+        self.labels = dict(labels or {})
+        self.counters = {}
+        self.timers = {}
+        self.runs = 0
+        self.elapsed = 0.0
+        self.memory_peak = None
+        self.profiler = None
+        self._active = 0
+        self._started = None
+        self._tracing = False
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        Adds the time spent inside the with block to the timer called name.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timers[name] = self.timers.get(name, 0.0) + elapsed
+
+    def sample(self, iteration, **state):
+        if (
+            self.on_sample is not None
+            and self.sample_every
+            and not iteration % self.sample_every
+        ):
+            self.on_sample(self, iteration, state)
+
+    def __enter__(self):
+        # A solver that calls another instrumented solver with the same
+        # telemetry (iterative_deepening's root search, say) is one run.
+        self._active += 1
+        if self._active > 1:
+            return self
+        self.runs += 1
+        if self.trace_memory:
+            import tracemalloc
+
+            self._tracing = not tracemalloc.is_tracing()
+            if self._tracing:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        if self.profile:
+            import cProfile
+
+            if self.profiler is None:
+                self.profiler = cProfile.Profile()
+            self.profiler.enable()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._active -= 1
+        if self._active:
+            return False
+        self.elapsed += time.perf_counter() - self._started
+        if self.profiler is not None:
+            self.profiler.disable()
+        if self.trace_memory:
+            import tracemalloc
+
+            peak = tracemalloc.get_traced_memory()[1]
+            self.memory_peak = max(self.memory_peak or 0, peak)
+            if self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+        return False
+
+    def profile_summary(self, limit=10):
+        """
+        The limit functions with the most cumulative time in the cProfile
+        capture, as (function, calls, cumulative seconds) triples.
+
+        Returns:
+            list of tuple
+        """
+        if self.profiler is None:
+            return []
+        import pstats
+
+        stats = pstats.Stats(self.profiler).stats
+        rows = [
+            (f"{filename}:{line}({name})", calls, cumulative)
+            for (filename, line, name), (_, calls, _, cumulative, _) in stats.items()
+        ]
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return rows[:limit]
+
+    def as_dict(self):
+        record = {
+            "solver": self.solver,
+            "labels": self.labels,
+            "runs": self.runs,
+            "elapsed": self.elapsed,
+            "counters": self.counters,
+            "timers": self.timers,
+        }
+        if self.memory_peak is not None:
+            record["memory_peak"] = self.memory_peak
+        if self.profiler is not None:
+            record["profile"] = self.profile_summary()
+        return record
+
+
+NULL_PHASE = contextlib.nullcontext()
+
+
+def phase(telemetry, name):
+    """
+    telemetry.phase(name), or a reusable do-nothing context if telemetry is
+    None. Meant for per-generation or per-depth phases; per-node work should
+    test telemetry itself.
+    """
+    if telemetry is None:
+        return NULL_PHASE
+    return telemetry.phase(name)
+
+
+def instrumented(solver):
+    """
+    Decorator for solvers taking a telemetry keyword argument: when one is
+    passed, the whole call is timed (and profiled, if asked for) as one run.
+    """
+
+    @functools.wraps(solver)
+    def wrapper(*args, telemetry=None, **kwargs):
+        if telemetry is None:
+            return solver(*args, **kwargs)
+        with telemetry:
+            return solver(*args, telemetry=telemetry, **kwargs)
+
+    return wrapper
+
+
+def write_json_lines(telemetries, path):
+    """
+    Appends one JSON object per Telemetry to the file at path.
+    """
+    with open(path, "a") as f:
+        for telemetry in telemetries:
+            f.write(json.dumps(telemetry.as_dict()) + "\n")
+
+
+def prometheus_labels(telemetry, **extra):
+    labels = dict(telemetry.labels, solver=telemetry.solver, **extra)
+    return ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in sorted(labels.items())
+    )
+
+
+def write_prometheus(telemetries, path):
+    """
+    Writes the telemetries to path in the Prometheus text exposition format,
+    for node_exporter's textfile collector. The file is replaced atomically
+    so the collector never reads half of it.
+    """
+    metrics = {
+        "comp469_solver_runs_total": ("counter", []),
+        "comp469_solver_seconds_total": ("counter", []),
+        "comp469_solver_events_total": ("counter", []),
+        "comp469_solver_phase_seconds_total": ("counter", []),
+        "comp469_solver_memory_peak_bytes": ("gauge", []),
+    }
+    for telemetry in telemetries:
+        labels = prometheus_labels(telemetry)
+        metrics["comp469_solver_runs_total"][1].append((labels, telemetry.runs))
+        metrics["comp469_solver_seconds_total"][1].append((labels, telemetry.elapsed))
+        for name, value in sorted(telemetry.counters.items()):
+            metrics["comp469_solver_events_total"][1].append(
+                (prometheus_labels(telemetry, event=name), value)
+            )
+        for name, value in sorted(telemetry.timers.items()):
+            metrics["comp469_solver_phase_seconds_total"][1].append(
+                (prometheus_labels(telemetry, phase=name), value)
+            )
+        if telemetry.memory_peak is not None:
+            metrics["comp469_solver_memory_peak_bytes"][1].append(
+                (labels, telemetry.memory_peak)
+            )
+
+    lines = []
+    for name, (kind, samples) in metrics.items():
+        if not samples:
+            continue
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(f"{name}{{{labels}}} {value}" for labels, value in samples)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp_path, path)
+
+
+def add_telemetry_arguments(parser):
+    """
+    Adds the --telemetry, --prometheus, --profile and --trace-memory options
+    shared by the command line entry points.
+    """
+    group = parser.add_argument_group("telemetry")
+    group.add_argument(
+        "--telemetry", metavar="PATH", help="append JSON-lines telemetry to PATH"
+    )
+    group.add_argument(
+        "--prometheus", metavar="PATH", help="write Prometheus text metrics to PATH"
+    )
+    group.add_argument(
+        "--profile", action="store_true", help="capture a cProfile of each solver"
+    )
+    group.add_argument(
+        "--trace-memory", action="store_true", help="record peak traced memory"
+    )
+
+
+def telemetry_from_arguments(args, solver, **labels):
+    """
+    The Telemetry the parsed options ask for, or None if none of them was
+    given.
+
+    Returns:
+        Telemetry or None
+    """
+    if not (args.telemetry or args.prometheus or args.profile or args.trace_memory):
+        return None
+    return Telemetry(
+        solver,
+        profile=args.profile,
+        trace_memory=args.trace_memory,
+        labels=labels,
+    )
+
+
+def export_telemetry(args, telemetries):
+    """
+    Writes the telemetries to the exporters the parsed options ask for. With
+    only --profile or --trace-memory given, what they captured is printed
+    instead.
+    """
+    telemetries = [telemetry for telemetry in telemetries if telemetry is not None]
+    if not telemetries:
+        return
+    if args.telemetry is not None:
+        write_json_lines(telemetries, args.telemetry)
+    if args.prometheus is not None:
+        write_prometheus(telemetries, args.prometheus)
+    if args.telemetry is None and args.prometheus is None:
+        print_telemetry_summary(telemetries)
+
+
+def print_telemetry_summary(telemetries):
+    for telemetry in telemetries:
+        print(
+            f"{telemetry.solver}: {telemetry.runs} runs in {telemetry.elapsed:.2f}s"
+        )
+        if telemetry.memory_peak is not None:
+            print(f"  peak traced memory: {telemetry.memory_peak} bytes")
+        for function, calls, cumulative in telemetry.profile_summary():
+            print(f"  {cumulative:8.3f}s {calls:>9} calls  {function}")
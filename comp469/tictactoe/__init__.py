@@ -0,0 +1,52 @@
+"""
+Tic-tac-toe on m x n boards with k in a row to win: list and bitboard
+boards, minimax with alpha-beta and a transposition table, iterative
+deepening, parallel root search, a solved-game opening book, Monte Carlo
+tree search and a headless self-play arena.
+"""
+from .board import BitboardTicTacToe, TicTacToe
+from .book import best_move, build_opening_book, opening_book
+from .game import arena, play_game, play_headless
+from .geometry import BoardGeometry, board_geometry
+from .mcts import MCTSPlayer
+from .ordering import KillerHistoryOrdering, MoveOrdering, StaticOrdering
+from .players import HumanPlayer, MinimaxPlayer, Player, RandomPlayer
+from .search import (
+    TRANSPOSITION_TABLE,
+    Search,
+    SearchTimeout,
+    TranspositionTable,
+    iterative_deepening,
+    minimax,
+    parallel_minimax,
+    window_evaluation,
+)
+
+__all__ = [
+    "BitboardTicTacToe",
+    "BoardGeometry",
+    "HumanPlayer",
+    "KillerHistoryOrdering",
+    "MCTSPlayer",
+    "MinimaxPlayer",
+    "MoveOrdering",
+    "Player",
+    "RandomPlayer",
+    "Search",
+    "SearchTimeout",
+    "StaticOrdering",
+    "TRANSPOSITION_TABLE",
+    "TicTacToe",
+    "TranspositionTable",
+    "arena",
+    "best_move",
+    "board_geometry",
+    "build_opening_book",
+    "iterative_deepening",
+    "minimax",
+    "opening_book",
+    "parallel_minimax",
+    "play_game",
+    "play_headless",
+    "window_evaluation",
+]
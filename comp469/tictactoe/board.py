@@ -0,0 +1,145 @@
+from .geometry import board_geometry, popcount
+
+
+class TicTacToe:
+    def __init__(self, rows=3, cols=3, k=3):
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.geometry = board_geometry(rows, cols, k)
+        self.board = [" " for _ in range(rows * cols)]
+        self.current_winner = None
+
+    def print_board(self):
+        for row in [
+            self.board[i * self.cols : (i + 1) * self.cols] for i in range(self.rows)
+        ]:
+            print("| " + " | ".join(row) + " |")
+
+    @staticmethod
+    def print_board_nums(rows=3, cols=3):
+        width = len(str(rows * cols - 1))
+        number_board = [
+            [str(i).rjust(width) for i in range(j * cols, (j + 1) * cols)]
+            for j in range(rows)
+        ]
+        for row in number_board:
+            print("| " + " | ".join(row) + " |")
+
+    def available_moves(self):
+        return [i for i, spot in enumerate(self.board) if spot == " "]
+
+    def empty_squares(self):
+        return " " in self.board
+
+    def num_empty_squares(self):
+        return self.board.count(" ")
+
+    def make_move(self, square, letter):
+        if self.board[square] == " ":
+            self.board[square] = letter
+            if self.winner(square, letter):
+                self.current_winner = letter
+            return True
+        return False
+
+    def undo_move(self, square):
+        self.board[square] = " "
+        self.current_winner = None
+
+    def bitboards(self):
+        """
+        Returns the board as (x_bits, o_bits), where bit i of a mask is set
+        when that player holds square i.
+
+        Returns:
+            tuple of int
+        """
+        x_bits = o_bits = 0
+        for i, spot in enumerate(self.board):
+            if spot == "X":
+                x_bits |= 1 << i
+            elif spot == "O":
+                o_bits |= 1 << i
+        return x_bits, o_bits
+
+    def winner(self, square, letter):
+        """
+        Returns True if letter at square completes k in a row, looking only
+        along the four lines through square.
+        """
+        row, col = divmod(square, self.cols)
+        for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            count = 1
+            for sign in (1, -1):
+                r, c = row + sign * d_row, col + sign * d_col
+                while (
+                    0 <= r < self.rows
+                    and 0 <= c < self.cols
+                    and self.board[r * self.cols + c] == letter
+                ):
+                    count += 1
+                    r, c = r + sign * d_row, c + sign * d_col
+            if count >= self.k:
+                return True
+        return False
+
+
+class BitboardTicTacToe(TicTacToe):
+    """
+    TicTacToe stored as one integer bitmask per player instead of a list of
+    letters. Moves, win checks and square counts are a few integer
+    operations each. board is rebuilt on access for printing only.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3):
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.geometry = board_geometry(rows, cols, k)
+        self.x_bits = 0
+        self.o_bits = 0
+        self.current_winner = None
+
+    @property
+    def board(self):
+        return [
+            "X" if self.x_bits >> i & 1 else "O" if self.o_bits >> i & 1 else " "
+            for i in range(self.geometry.cells)
+        ]
+
+    def available_moves(self):
+        return list(
+            self.geometry.squares(self.geometry.full & ~(self.x_bits | self.o_bits))
+        )
+
+    def empty_squares(self):
+        return self.x_bits | self.o_bits != self.geometry.full
+
+    def num_empty_squares(self):
+        return self.geometry.cells - popcount(self.x_bits | self.o_bits)
+
+    def make_move(self, square, letter):
+        bit = 1 << square
+        if (self.x_bits | self.o_bits) & bit:
+            return False
+        if letter == "X":
+            self.x_bits |= bit
+        else:
+            self.o_bits |= bit
+        if self.winner(square, letter):
+            self.current_winner = letter
+        return True
+
+    def undo_move(self, square):
+        mask = ~(1 << square)
+        self.x_bits &= mask
+        self.o_bits &= mask
+        self.current_winner = None
+
+    def bitboards(self):
+        return self.x_bits, self.o_bits
+
+    def winner(self, square, letter):
+        bits = self.x_bits if letter == "X" else self.o_bits
+        return self.geometry.completes_line(bits, square)
@@ -0,0 +1,213 @@
+import functools
+import os
+import struct
+import tempfile
+
+from .geometry import board_geometry, popcount
+from .search import iterative_deepening, minimax
+
+# The package directory may be read-only once installed, so the book lives
+# in the user's cache unless COMP469_BOOK_PATH says otherwise.
+BOOK_PATH = os.environ.get("COMP469_BOOK_PATH") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "comp469",
+    "tictactoe_book.bin",
+)
+BOOK_MAGIC = b"TTTBOOK1"
+BOOK_HEADER = struct.Struct("<8sI")
+# Canonical key, then the score of playing each of the 9 squares.
+BOOK_RECORD = struct.Struct("<I9b")
+NO_MOVE = -128
+
+
+def side_to_move(x_bits, o_bits):
+    return "X" if popcount(x_bits) == popcount(o_bits) else "O"
+
+
+def solve_game():
+    """
+    Solves every reachable 3x3 position retrogradely. Positions are first
+    enumerated forward from the empty board (X moves first), one layer per
+    number of pieces, then scored from the fullest layer back to the empty
+    board so every child is already solved when its parent is reached.
+
+    Returns:
+        dict mapping canonical key to a list of 9 move scores in canonical
+        orientation, NO_MOVE for occupied squares
+    """
+    geometry = board_geometry(3, 3, 3)
+    cells = geometry.cells
+    layers = [{0}] + [set() for _ in range(cells)]
+    for pieces in range(cells):
+        for key in layers[pieces]:
+            x_bits, o_bits = key & geometry.full, key >> cells
+            player = side_to_move(x_bits, o_bits)
+            for square in geometry.squares(geometry.full & ~(x_bits | o_bits)):
+                child_x, child_o = x_bits, o_bits
+                if player == "X":
+                    child_x |= 1 << square
+                else:
+                    child_o |= 1 << square
+                mover_bits = child_x if player == "X" else child_o
+                if pieces < cells - 1 and not geometry.completes_line(
+                    mover_bits, square
+                ):
+                    layers[pieces + 1].add(geometry.canonical_key(child_x, child_o))
+
+    book = {}
+    for pieces in range(cells - 1, -1, -1):
+        for key in layers[pieces]:
+            x_bits, o_bits = key & geometry.full, key >> cells
+            player = side_to_move(x_bits, o_bits)
+            scores = [NO_MOVE] * cells
+            for square in geometry.squares(geometry.full & ~(x_bits | o_bits)):
+                child_x, child_o = x_bits, o_bits
+                if player == "X":
+                    child_x |= 1 << square
+                else:
+                    child_o |= 1 << square
+                empty = cells - popcount(child_x | child_o)
+                mover_bits = child_x if player == "X" else child_o
+                if geometry.completes_line(mover_bits, square):
+                    scores[square] = empty + 1 if player == "X" else -(empty + 1)
+                elif empty == 0:
+                    scores[square] = 0
+                else:
+                    child_scores = [
+                        score
+                        for score in book[geometry.canonical_key(child_x, child_o)]
+                        if score != NO_MOVE
+                    ]
+                    # The reply is made by the other player.
+                    if player == "X":
+                        scores[square] = min(child_scores)
+                    else:
+                        scores[square] = max(child_scores)
+            book[key] = scores
+    return book
+
+
+def build_opening_book(path=BOOK_PATH):
+    """
+    Solves the game and writes the book to path.
+
+    Returns:
+        int, the number of positions written
+    """
+    book = solve_game()
+    write_opening_book(book, path)
+    return len(book)
+
+
+def write_opening_book(book, path):
+    """
+    Writes one record per canonical position to path, creating its
+    directory if needed. The file is written to a temporary file of its own
+    next to path first and then renamed over it, so a reader never sees a
+    partial book, even with several processes writing it at once.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory or None
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(BOOK_HEADER.pack(BOOK_MAGIC, len(book)))
+            for key in sorted(book):
+                f.write(BOOK_RECORD.pack(key, *book[key]))
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_opening_book(path=BOOK_PATH):
+    """
+    Reads a book written by build_opening_book.
+
+    Returns:
+        dict mapping canonical key to a tuple of 9 move scores
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, count = BOOK_HEADER.unpack_from(data)
+    if magic != BOOK_MAGIC:
+        raise ValueError(f"{path} is not a tic-tac-toe opening book")
+    book = {}
+    for record in BOOK_RECORD.iter_unpack(data[BOOK_HEADER.size :]):
+        book[record[0]] = record[1:]
+    if len(book) != count:
+        raise ValueError(f"{path} is truncated")
+    return book
+
+
+@functools.lru_cache(maxsize=None)
+def opening_book(path=BOOK_PATH):
+    """
+    Loads the book at path once per process. If there is no book there yet,
+    or it cannot be read, the game is solved (which takes a few hundredths
+    of a second) and the book is saved to path for next time, if path can
+    be written.
+
+    Returns:
+        dict mapping canonical key to a tuple of 9 move scores
+    """
+    try:
+        return load_opening_book(path)
+    except (OSError, ValueError, struct.error):
+        pass
+    book = {key: tuple(scores) for key, scores in solve_game().items()}
+    try:
+        write_opening_book(book, path)
+    except OSError:
+        pass
+    return book
+
+
+def book_move(book, state, player):
+    """
+    Looks the position up in book and returns the move minimax would pick,
+    as {"position": ..., "score": ...}.
+
+    Returns:
+        dict, or None if the board is not 3x3 or the position is over, not
+        player's turn or not in the book
+    """
+    geometry = board_geometry(3, 3, 3)
+    if state.geometry is not geometry:
+        return None
+    x_bits, o_bits = state.bitboards()
+    if state.current_winner or player != side_to_move(x_bits, o_bits):
+        return None
+    key, canonical_square = geometry.canonical_orientation(x_bits, o_bits)
+    scores = book.get(key)
+    if scores is None:
+        return None
+    best = None
+    for square in state.available_moves():
+        score = scores[canonical_square[square]]
+        if (
+            best is None
+            or (player == "X" and score > best["score"])
+            or (player == "O" and score < best["score"])
+        ):
+            best = {"position": square, "score": score}
+    return best
+
+
+def best_move(state, player, book_path=BOOK_PATH, time_limit=1.0):
+    """
+    Returns the move for player as {"position": ..., "score": ...}.
+    On 3x3 it is read from the opening book (built on first use; see
+    opening_book), falling back to minimax for positions the book does not
+    cover; larger boards get iterative_deepening with a budget of
+    time_limit seconds.
+    """
+    if state.geometry is not board_geometry(3, 3, 3):
+        return iterative_deepening(state, player, time_limit)
+    move = book_move(opening_book(book_path), state, player)
+    if move is not None:
+        return move
+    return minimax(state, player)
@@ -0,0 +1,235 @@
+import argparse
+import math
+import random
+import time
+
+from .board import BitboardTicTacToe, TicTacToe
+from .book import BOOK_PATH, build_opening_book
+from .mcts import MCTSPlayer
+from .players import HumanPlayer, MinimaxPlayer, RandomPlayer
+
+PLAYERS = {
+    "human": HumanPlayer,
+    "minimax": MinimaxPlayer,
+    "random": RandomPlayer,
+    "mcts": MCTSPlayer,
+}
+
+
+def play_game(rows=3, cols=3, k=3, time_limit=1.0, x_player=None, o_player=None):
+    """
+    Plays one game on the console, a human as X against best_move as O
+    unless other players are given.
+    """
+    if x_player is None:
+        x_player = HumanPlayer()
+    if o_player is None:
+        o_player = MinimaxPlayer(time_limit)
+    players = {"X": x_player, "O": o_player}
+    t = TicTacToe(rows, cols, k)
+    t.print_board_nums(rows, cols)
+
+    letter = "X"
+    while t.empty_squares():
+        square = players[letter].get_move(t, letter)["position"]
+
+        if t.make_move(square, letter):
+            print(f"{letter} makes a move to square {square}")
+            t.print_board()
+            print("")
+
+            if t.current_winner:
+                print(letter + " wins!")
+                return
+
+            letter = "O" if letter == "X" else "X"
+
+        if not t.empty_squares():
+            print("It's a tie!")
+
+
+def play_headless(x_player, o_player, rows=3, cols=3, k=3, seed=None):
+    """
+    Plays one game between two players with no input or output.
+
+    Returns:
+        dict with the "winner" ("X", "O" or None for a draw), the "moves"
+        in order and the "latencies" in seconds of each player's moves
+    """
+    seeds = random.Random(seed)
+    x_player.reset(seeds.getrandbits(64))
+    o_player.reset(seeds.getrandbits(64))
+    players = {"X": x_player, "O": o_player}
+    t = BitboardTicTacToe(rows, cols, k)
+    moves = []
+    latencies = {"X": [], "O": []}
+
+    letter = "X"
+    while t.empty_squares():
+        start = time.perf_counter()
+        square = players[letter].get_move(t, letter)["position"]
+        latencies[letter].append(time.perf_counter() - start)
+        if not t.make_move(square, letter):
+            raise ValueError(f"{letter} played the taken square {square}")
+        moves.append(square)
+        if t.current_winner:
+            break
+        letter = "O" if letter == "X" else "X"
+    return {"winner": t.current_winner, "moves": moves, "latencies": latencies}
+
+
+def play_headless_task(task):
+    return play_headless(*task)
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an already sorted list, None if it is empty.
+    """
+    if not sorted_values:
+        return None
+    rank = math.ceil(fraction * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+def arena(x_player, o_player, games=100, rows=3, cols=3, k=3, processes=None, seed=0):
+    """
+    Plays games headless games between x_player and o_player, in a pool of
+    processes worker processes if given (each worker plays with its own
+    copy of the players), and reports throughput, per-move latency and
+    outcomes. Game i is seeded from seed and i, so a run can be repeated.
+
+    Returns:
+        dict
+    """
+    if games < 1:
+        raise ValueError("arena needs at least one game")
+    tasks = [
+        (x_player, o_player, rows, cols, k, f"{seed}:{i}") for i in range(games)
+    ]
+    start = time.perf_counter()
+    if processes is None:
+        records = [play_headless_task(task) for task in tasks]
+    else:
+        import multiprocessing
+
+        with multiprocessing.Pool(processes) as pool:
+            chunksize = max(1, games // (4 * processes))
+            records = pool.map(play_headless_task, tasks, chunksize)
+    seconds = time.perf_counter() - start
+
+    outcomes = {"X": 0, "O": 0, "draw": 0}
+    latencies = {"X": [], "O": []}
+    for record in records:
+        outcomes[record["winner"] or "draw"] += 1
+        for letter in latencies:
+            latencies[letter].extend(record["latencies"][letter])
+    move_latency = {}
+    for letter, values in latencies.items():
+        values.sort()
+        move_latency[letter] = {
+            "moves": len(values),
+            "p50": percentile(values, 0.5),
+            "p90": percentile(values, 0.9),
+            "p99": percentile(values, 0.99),
+            "max": values[-1] if values else None,
+        }
+    return {
+        "games": games,
+        "seconds": seconds,
+        "games_per_second": games / seconds if seconds else math.inf,
+        "mean_moves": sum(len(record["moves"]) for record in records) / games,
+        "outcomes": outcomes,
+        "move_latency": move_latency,
+    }
+
+
+def print_arena_report(report):
+    outcomes = report["outcomes"]
+    print(
+        f"{report['games']} games in {report['seconds']:.2f}s "
+        f"({report['games_per_second']:.1f} games/s, "
+        f"{report['mean_moves']:.1f} moves per game)"
+    )
+    print(
+        f"X wins: {outcomes['X']}, O wins: {outcomes['O']}, "
+        f"draws: {outcomes['draw']}"
+    )
+    for letter, stats in report["move_latency"].items():
+        if not stats["moves"]:
+            continue
+        print(
+            f"{letter} move latency over {stats['moves']} moves: "
+            + ", ".join(
+                f"{name} {stats[name] * 1000:.3f}ms"
+                for name in ("p50", "p90", "p99", "max")
+            )
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="comp469 tictactoe", description="Play tic-tac-toe against minimax."
+    )
+    parser.add_argument("--rows", type=int, default=3)
+    parser.add_argument("--cols", type=int, default=3)
+    parser.add_argument("-k", type=int, default=3, help="pieces in a row to win")
+    parser.add_argument(
+        "--time-limit",
+        type=float,
+        default=1.0,
+        help="seconds the AI may think per move on boards larger than 3x3",
+    )
+    parser.add_argument("-x", choices=PLAYERS, default="human", help="player for X")
+    parser.add_argument("-o", choices=PLAYERS, default="minimax", help="player for O")
+    parser.add_argument(
+        "--playouts", type=int, default=1000, help="playouts per move for mcts"
+    )
+    parser.add_argument(
+        "--arena",
+        type=int,
+        metavar="GAMES",
+        help="play GAMES headless games between -x and -o and report statistics",
+    )
+    parser.add_argument(
+        "--processes", type=int, help="worker processes for --arena games"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed for --arena games")
+    parser.add_argument(
+        "--build-book",
+        nargs="?",
+        const=BOOK_PATH,
+        metavar="PATH",
+        help="solve the game, write the opening book to PATH and exit",
+    )
+    args = parser.parse_args(argv)
+
+    def make_player(name):
+        if name == "minimax":
+            return MinimaxPlayer(args.time_limit)
+        if name == "mcts":
+            return MCTSPlayer(args.playouts, time_limit=args.time_limit)
+        return PLAYERS[name]()
+
+    x_player, o_player = make_player(args.x), make_player(args.o)
+    if args.build_book:
+        count = build_opening_book(args.build_book)
+        print(f"Wrote {count} positions to {args.build_book}")
+    elif args.arena is not None:
+        if args.arena < 1:
+            parser.error("--arena needs at least one game")
+        if isinstance(x_player, HumanPlayer) or isinstance(o_player, HumanPlayer):
+            parser.error("--arena needs computer players for both -x and -o")
+        report = arena(
+            x_player,
+            o_player,
+            args.arena,
+            args.rows,
+            args.cols,
+            args.k,
+            args.processes,
+            args.seed,
+        )
+        print_arena_report(report)
+    else:
+        play_game(args.rows, args.cols, args.k, args.time_limit, x_player, o_player)
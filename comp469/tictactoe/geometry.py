@@ -0,0 +1,227 @@
+import functools
+
+from .ordering import StaticOrdering
+
+
+def board_symmetries(rows=3, cols=3):
+    """
+    Returns the rotations and reflections of a rows x cols board as index
+    permutations: 8 for a square board, 4 otherwise. Applying a permutation
+    p to a board gives [board[i] for i in p].
+
+    Returns:
+        list of tuple of int
+    """
+    cells = range(rows * cols)
+    flip_rows = [(rows - 1 - i // cols) * cols + i % cols for i in cells]
+    flip_cols = [(i // cols) * cols + cols - 1 - i % cols for i in cells]
+    if rows != cols:
+        rotate_180 = [flip_rows[j] for j in flip_cols]
+        return [tuple(cells), tuple(flip_rows), tuple(flip_cols), tuple(rotate_180)]
+    size = rows
+    rotate = [(size - 1 - i % size) * size + i // size for i in cells]
+    symmetries = []
+    perm = list(cells)
+    for _ in range(4):
+        symmetries.append(tuple(perm))
+        symmetries.append(tuple(perm[j] for j in flip_cols))
+        perm = [perm[j] for j in rotate]
+    return symmetries
+
+
+def popcount(mask):
+    return bin(mask).count("1")
+
+
+# Symmetry transforms of a bitboard are looked up CHUNK_BITS squares at a time.
+CHUNK_BITS = 9
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+# Past this many squares symmetric positions are too rare to pay for the
+# transforms, and positions are keyed as they are.
+MAX_SYMMETRY_CELLS = 25
+
+
+class BoardGeometry:
+    """
+    Precomputed tables for a rows x cols board where k in a row wins.
+    Bitboards use bit i for square i = row * cols + col.
+    """
+
+    def __init__(self, rows, cols, k):
+        if rows < 1 or cols < 1 or not 1 <= k <= max(rows, cols):
+            raise ValueError(f"no {k} in a row fits on a {rows}x{cols} board")
+        self.rows = rows
+        self.cols = cols
+        self.k = k
+        self.cells = rows * cols
+        self.full = (1 << self.cells) - 1
+
+        lines = []
+        for row in range(rows):
+            for col in range(cols):
+                for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_row, end_col = row + d_row * (k - 1), col + d_col * (k - 1)
+                    if 0 <= end_row < rows and 0 <= end_col < cols:
+                        lines.append(
+                            tuple(
+                                (row + d_row * i) * cols + col + d_col * i
+                                for i in range(k)
+                            )
+                        )
+        self.win_lines = tuple(lines)
+        self.win_masks = tuple(sum(1 << i for i in line) for line in lines)
+        # Lines through each square, so a win is only checked around the move.
+        self.square_win_masks = tuple(
+            tuple(mask for mask in self.win_masks if mask >> square & 1)
+            for square in range(self.cells)
+        )
+        # Squares on the most lines first, then nearest the center. On 3x3
+        # this is center, corners, edges.
+        center_row, center_col = (rows - 1) / 2, (cols - 1) / 2
+        self.preference = tuple(
+            sorted(
+                range(self.cells),
+                key=lambda square: (
+                    -len(self.square_win_masks[square]),
+                    (square // cols - center_row) ** 2
+                    + (square % cols - center_col) ** 2,
+                    square,
+                ),
+            )
+        )
+        self.ordering = StaticOrdering(self.preference)
+        self.neighborhoods = {}
+
+        if self.cells <= CHUNK_BITS:
+            square_table = tuple(
+                tuple(i for i in range(self.cells) if mask >> i & 1)
+                for mask in range(self.full + 1)
+            )
+            self.squares = square_table.__getitem__
+
+        if self.cells <= MAX_SYMMETRY_CELLS:
+            self.symmetries = board_symmetries(rows, cols)
+        else:
+            self.symmetries = [tuple(range(self.cells))]
+        # inverse_symmetries[s][square] is where symmetry s moves square to.
+        self.inverse_symmetries = tuple(
+            tuple(perm.index(square) for square in range(self.cells))
+            for perm in self.symmetries
+        )
+        # symmetry_chunks[s][c][bits] is symmetry s applied to the squares of
+        # chunk c holding bits.
+        self.symmetry_chunks = tuple(
+            tuple(
+                tuple(
+                    sum(
+                        1 << inverse[start + i]
+                        for i in range(CHUNK_BITS)
+                        if bits >> i & 1 and start + i < self.cells
+                    )
+                    for bits in range(CHUNK_MASK + 1)
+                )
+                for start in range(0, self.cells, CHUNK_BITS)
+            )
+            for inverse in self.inverse_symmetries[1:]
+        )
+        self.single_chunk_tables = tuple(
+            chunks[0] for chunks in self.symmetry_chunks if len(chunks) == 1
+        )
+
+    def __reduce__(self):
+        return board_geometry, (self.rows, self.cols, self.k)
+
+    def squares(self, mask):
+        """
+        Returns the squares set in mask, in increasing order.
+        """
+        squares = []
+        while mask:
+            low = mask & -mask
+            squares.append(low.bit_length() - 1)
+            mask ^= low
+        return tuple(squares)
+
+    def completes_line(self, bits, square):
+        """
+        Returns True if bits holds a full line through square.
+        """
+        for mask in self.square_win_masks[square]:
+            if bits & mask == mask:
+                return True
+        return False
+
+    def transform(self, s, mask):
+        """
+        Applies symmetry s (an index into symmetries, 0 is the identity) to
+        the squares set in mask.
+        """
+        if s == 0:
+            return mask
+        result = 0
+        for table in self.symmetry_chunks[s - 1]:
+            result |= table[mask & CHUNK_MASK]
+            mask >>= CHUNK_BITS
+        return result
+
+    def canonical_key(self, x_bits, o_bits):
+        """
+        Encodes a position as the smallest integer over all of its rotations
+        and reflections, so symmetric positions share one cache entry.
+
+        Returns:
+            int
+        """
+        cells = self.cells
+        key = x_bits | o_bits << cells
+        if self.single_chunk_tables:
+            for table in self.single_chunk_tables:
+                key = min(key, table[x_bits] | table[o_bits] << cells)
+            return key
+        for s in range(1, len(self.symmetries)):
+            key = min(
+                key, self.transform(s, x_bits) | self.transform(s, o_bits) << cells
+            )
+        return key
+
+    def canonical_orientation(self, x_bits, o_bits):
+        """
+        Returns (canonical key, inverse permutation) for the symmetry that
+        produces the canonical key, so that square i of the position is
+        square inverse[i] of the canonical position.
+        """
+        return min(
+            (
+                self.transform(s, x_bits) | self.transform(s, o_bits) << self.cells,
+                inverse,
+            )
+            for s, inverse in enumerate(self.inverse_symmetries)
+        )
+
+    def neighborhood(self, radius):
+        """
+        Returns, for each square, the mask of squares at most radius rows and
+        columns away from it.
+
+        Returns:
+            tuple of int
+        """
+        masks = self.neighborhoods.get(radius)
+        if masks is None:
+            masks = self.neighborhoods[radius] = tuple(
+                sum(
+                    1 << (row * self.cols + col)
+                    for row in range(max(0, r - radius), min(self.rows, r + radius + 1))
+                    for col in range(max(0, c - radius), min(self.cols, c + radius + 1))
+                )
+                for r, c in (divmod(square, self.cols) for square in range(self.cells))
+            )
+        return masks
+
+
+@functools.lru_cache(maxsize=None)
+def board_geometry(rows=3, cols=3, k=3):
+    """
+    Returns the shared BoardGeometry for a rows x cols board with k to win.
+    """
+    return BoardGeometry(rows, cols, k)
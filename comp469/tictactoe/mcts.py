@@ -0,0 +1,316 @@
+import math
+import os
+import random
+import time
+
+from .players import Player
+from .search import game_over_result
+
+
+class MCTSNode:
+    """
+    A position in the Monte Carlo search tree, reached by player taking
+    move. value sums the playout results through this node from player's
+    point of view (1 for a win, 0 for a draw, -1 for a loss).
+    """
+
+    __slots__ = (
+        "x_bits",
+        "o_bits",
+        "player",
+        "move",
+        "parent",
+        "winner",
+        "children",
+        "untried",
+        "visits",
+        "value",
+    )
+
+    def __init__(self, x_bits, o_bits, player, move, parent, winner, untried):
+        self.x_bits = x_bits
+        self.o_bits = o_bits
+        self.player = player
+        self.move = move
+        self.parent = parent
+        self.winner = winner
+        self.children = []
+        self.untried = untried
+        self.visits = 0
+        self.value = 0
+
+
+def mcts_worker(task):
+    """
+    Runs one independent MCTS tree in a worker process.
+
+    Returns:
+        list of (move, visits, value) for the children of the root
+    """
+    (
+        geometry,
+        x_bits,
+        o_bits,
+        player,
+        playouts,
+        deadline,
+        exploration,
+        radius,
+        seed,
+    ) = task
+    # The budget itself is the deadline passed to run; the time limit only
+    # has to be set when the move is timed rather than counted.
+    time_limit = None if deadline is None else max(deadline - time.perf_counter(), 0)
+    mcts = MCTSPlayer(playouts, time_limit, exploration, radius, seed=seed)
+    root = mcts.new_root(geometry, x_bits, o_bits, player)
+    mcts.run(root, playouts, deadline)
+    return [(child.move, child.visits, child.value) for child in root.children]
+
+
+class MCTSPlayer(Player):
+    """
+    Monte Carlo tree search (UCT) player for boards too large to search
+    exhaustively.
+
+    Each move runs playouts random games (or as many as fit in time_limit
+    seconds, whichever runs out first; None means no limit on that
+    budget), growing a tree from the current position and picking the most
+    visited move. exploration is the UCT constant. The tree only grows
+    through moves within radius rows and columns of a piece already on the
+    board (all moves if radius is None); the random playouts themselves use
+    every empty square. The subtree under the chosen move is kept, so the
+    next call starts from whatever was already learned about the
+    opponent's reply.
+
+    With processes set, every move instead runs that many independent trees
+    in a pool of worker processes, splitting the playouts between them and
+    adding up their root statistics. Trees are not kept between moves then.
+    Call close() (or use the player as a context manager) to stop the pool.
+    """
+
+    def __init__(
+        self,
+        playouts=1000,
+        time_limit=None,
+        exploration=math.sqrt(2),
+        radius=2,
+        processes=None,
+        seed=None,
+    ):
+        if playouts is None and time_limit is None:
+            raise ValueError("MCTSPlayer needs a playout or a time budget")
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.exploration = exploration
+        self.radius = radius
+        self.processes = processes
+        self.rng = random.Random(seed)
+        self.geometry = None
+        self.root = None
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool = None
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+        self.root = None
+
+    def __getstate__(self):
+        # A running pool cannot be sent to another process; the copy makes
+        # its own when it needs one.
+        state = self.__dict__.copy()
+        state["pool"] = None
+        return state
+
+    def new_root(self, geometry, x_bits, o_bits, player):
+        self.geometry = geometry
+        other_player = "O" if player == "X" else "X"
+        return self.new_node(x_bits, o_bits, other_player, None, None, None)
+
+    def new_node(self, x_bits, o_bits, player, move, parent, winner):
+        geometry = self.geometry
+        occupied = x_bits | o_bits
+        untried = []
+        if winner is None and occupied != geometry.full:
+            moves = geometry.full & ~occupied
+            if self.radius is not None and occupied:
+                neighborhood = geometry.neighborhood(self.radius)
+                near = 0
+                for square in geometry.squares(occupied):
+                    near |= neighborhood[square]
+                moves &= near
+            untried = list(geometry.squares(moves))
+            self.rng.shuffle(untried)
+        return MCTSNode(x_bits, o_bits, player, move, parent, winner, untried)
+
+    def reuse_root(self, geometry, x_bits, o_bits, player):
+        """
+        Returns the node of the kept tree for this position, if the position
+        is the kept root or one of its children, else a new root.
+        """
+        root = self.root
+        if root is not None and self.geometry is geometry:
+            for node in [root] + root.children:
+                same_position = (node.x_bits, node.o_bits) == (x_bits, o_bits)
+                if same_position and node.player != player:
+                    node.parent = None
+                    return node
+        return self.new_root(geometry, x_bits, o_bits, player)
+
+    def get_move(self, state, player):
+        """
+        Returns the move for player as {"position": ..., "score": ...,
+        "playouts": ...}, where score is the chosen move's mean playout
+        result from X's point of view and playouts how many playouts went
+        into the decision.
+        """
+        result = game_over_result(state, player)
+        if result is not None:
+            return dict(result, playouts=0)
+
+        deadline = None
+        if self.time_limit is not None:
+            deadline = time.perf_counter() + self.time_limit
+        x_bits, o_bits = state.bitboards()
+        if self.processes is not None:
+            return self.get_parallel_move(
+                state.geometry, x_bits, o_bits, player, deadline
+            )
+
+        root = self.reuse_root(state.geometry, x_bits, o_bits, player)
+        self.run(root, self.playouts, deadline)
+        best = max(root.children, key=lambda child: child.visits)
+        self.root = best
+        sign = 1 if player == "X" else -1
+        return {
+            "position": best.move,
+            "score": sign * best.value / best.visits,
+            "playouts": root.visits,
+        }
+
+    def get_parallel_move(self, geometry, x_bits, o_bits, player, deadline):
+        if self.pool is None:
+            import multiprocessing
+
+            self.pool = multiprocessing.Pool(self.processes)
+        workers = self.processes or os.cpu_count() or 1
+        playouts = None
+        if self.playouts is not None:
+            playouts = -(-self.playouts // workers)
+        tasks = [
+            (
+                geometry,
+                x_bits,
+                o_bits,
+                player,
+                playouts,
+                deadline,
+                self.exploration,
+                self.radius,
+                self.rng.getrandbits(64),
+            )
+            for _ in range(workers)
+        ]
+        visits = {}
+        values = {}
+        for children in self.pool.map(mcts_worker, tasks):
+            for move, child_visits, child_value in children:
+                visits[move] = visits.get(move, 0) + child_visits
+                values[move] = values.get(move, 0) + child_value
+        move = max(visits, key=visits.__getitem__)
+        sign = 1 if player == "X" else -1
+        return {
+            "position": move,
+            "score": sign * values[move] / visits[move],
+            "playouts": sum(visits.values()),
+        }
+
+    def run(self, root, playouts, deadline):
+        """
+        Adds playouts to the tree under root until playouts have run or the
+        deadline (a time.perf_counter() value) has passed. At least one
+        playout always runs, so the root has a child to choose.
+        """
+        count = 0
+        while True:
+            self.playout(root)
+            count += 1
+            if playouts is not None and count >= playouts:
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+    def playout(self, root):
+        """
+        Walks down the tree by UCT, adds one new node, plays a random game
+        from it and backs the result up to root.
+        """
+        node = root
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            exploration = self.exploration
+            node = max(
+                node.children,
+                key=lambda child: child.value / child.visits
+                + exploration * math.sqrt(log_visits / child.visits),
+            )
+        if node.untried:
+            node = self.expand(node, node.untried.pop())
+
+        result = self.rollout(node)
+        while node is not None:
+            node.visits += 1
+            node.value += result if node.player == "X" else -result
+            node = node.parent
+
+    def expand(self, node, square):
+        player = "O" if node.player == "X" else "X"
+        x_bits, o_bits = node.x_bits, node.o_bits
+        if player == "X":
+            x_bits |= 1 << square
+            won = self.geometry.completes_line(x_bits, square)
+        else:
+            o_bits |= 1 << square
+            won = self.geometry.completes_line(o_bits, square)
+        child = self.new_node(
+            x_bits, o_bits, player, square, node, player if won else None
+        )
+        node.children.append(child)
+        return child
+
+    def rollout(self, node):
+        """
+        Plays random moves from node to the end of the game on a copy of its
+        bitboards.
+
+        Returns:
+            1 if X wins, -1 if O wins, 0 for a draw
+        """
+        if node.winner is not None:
+            return 1 if node.winner == "X" else -1
+        geometry = self.geometry
+        x_bits, o_bits = node.x_bits, node.o_bits
+        moves = list(geometry.squares(geometry.full & ~(x_bits | o_bits)))
+        self.rng.shuffle(moves)
+        player = "O" if node.player == "X" else "X"
+        for square in moves:
+            if player == "X":
+                x_bits |= 1 << square
+                if geometry.completes_line(x_bits, square):
+                    return 1
+                player = "O"
+            else:
+                o_bits |= 1 << square
+                if geometry.completes_line(o_bits, square):
+                    return -1
+                player = "X"
+        return 0
@@ -0,0 +1,71 @@
+CENTER_CORNERS_EDGES = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+
+class MoveOrdering:
+    """
+    Decides the order in which alpha-beta search tries moves. The base class
+    keeps the order of available_moves() and learns nothing from cutoffs.
+    """
+
+    def order(self, moves, ply):
+        return moves
+
+    def record_cutoff(self, move, ply):
+        pass
+
+
+class StaticOrdering(MoveOrdering):
+    """
+    Tries moves by a fixed preference, center then corners then edges
+    by default. Squares missing from the preference go last.
+    """
+
+    def __init__(self, preference=CENTER_CORNERS_EDGES, cache_size=65536):
+        self.rank = {square: i for i, square in enumerate(preference)}
+        self.orders = {}
+        self.cache_size = cache_size
+
+    def square_rank(self, square):
+        return self.rank.get(square, len(self.rank) + square)
+
+    def order(self, moves, ply):
+        moves = tuple(moves)
+        ordered = self.orders.get(moves)
+        if ordered is None:
+            ordered = sorted(moves, key=self.square_rank)
+            if len(self.orders) < self.cache_size:
+                self.orders[moves] = ordered
+        return ordered
+
+
+class KillerHistoryOrdering(StaticOrdering):
+    """
+    Tries the killer moves of this ply first (the last moves that caused a
+    beta cutoff here), then the rest by how often they caused cutoffs
+    anywhere, falling back to the static preference on ties.
+    """
+
+    def __init__(self, preference=CENTER_CORNERS_EDGES, killers_per_ply=2):
+        super().__init__(preference)
+        self.killers_per_ply = killers_per_ply
+        self.killers = {}
+        self.history = {}
+
+    def order(self, moves, ply):
+        killers = self.killers.get(ply, ())
+        return sorted(
+            moves,
+            key=lambda move: (
+                move not in killers,
+                -self.history.get(move, 0),
+                self.square_rank(move),
+            ),
+        )
+
+    def record_cutoff(self, move, ply):
+        killers = self.killers.setdefault(ply, [])
+        if move in killers:
+            killers.remove(move)
+        killers.insert(0, move)
+        del killers[self.killers_per_ply :]
+        self.history[move] = self.history.get(move, 0) + 1
@@ -0,0 +1,55 @@
+import random
+
+from .book import best_move
+
+
+class Player:
+    """
+    A move source for play_game, play_headless and arena. get_move returns
+    a dict with at least "position"; reset is called with a seed before
+    every game.
+    """
+
+    def reset(self, seed=None):
+        pass
+
+    def get_move(self, state, player):
+        raise NotImplementedError
+
+
+class MinimaxPlayer(Player):
+    """
+    Plays best_move: the opening book or minimax on 3x3, iterative deepening
+    with time_limit seconds per move on larger boards.
+    """
+
+    def __init__(self, time_limit=1.0):
+        self.time_limit = time_limit
+
+    def get_move(self, state, player):
+        return best_move(state, player, time_limit=self.time_limit)
+
+
+class RandomPlayer(Player):
+    """
+    Plays a uniformly random empty square.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def reset(self, seed=None):
+        self.rng.seed(seed)
+
+    def get_move(self, state, player):
+        return {"position": self.rng.choice(state.available_moves())}
+
+
+class HumanPlayer(Player):
+    """
+    Asks for moves on standard input.
+    """
+
+    def get_move(self, state, player):
+        last = len(state.board) - 1
+        return {"position": int(input(f"{player}'s turn. Input move (0-{last}): "))}
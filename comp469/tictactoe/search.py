@@ -0,0 +1,584 @@
+import contextlib
+import math
+import time
+from collections import OrderedDict
+
+from ..telemetry import instrumented, phase
+from .geometry import popcount
+
+
+class TranspositionTable:
+    """
+    Bounded cache of minimax results keyed on canonical board encodings.
+    Each entry is a (flag, score, depth) triple, where flag tells whether
+    score is the exact value or only a lower/upper bound found by alpha-beta
+    search, and depth is how many moves ahead it was searched.
+    Once max_size entries are stored the least recently used one is evicted.
+    """
+
+    def __init__(self, max_size=65536):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Shared by every search so later moves and later games reuse earlier work.
+TRANSPOSITION_TABLE = TranspositionTable()
+
+
+def window_evaluation(geometry, x_bits, o_bits):
+    """
+    Heuristic score of a position that is not over, from X's point of view.
+    Every line still open to only one player counts for that player, 4 times
+    more for each piece already on it. The total is scaled to lie strictly
+    between -1 and 1, below the smallest win score.
+
+    Returns:
+        float
+    """
+    score = 0
+    for mask in geometry.win_masks:
+        x_line = x_bits & mask
+        o_line = o_bits & mask
+        if not o_line:
+            score += 4 ** popcount(x_line)
+        elif not x_line:
+            score -= 4 ** popcount(o_line)
+    return score / (len(geometry.win_masks) * 4**geometry.k + 1)
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search once its deadline has passed.
+    """
+
+
+class Search:
+    """
+    Alpha-beta search over (x_bits, o_bits) positions of one board geometry.
+
+    Each call is given how many more moves (depth) to look ahead; a position
+    still undecided at the end of that is scored by evaluate instead. With
+    depth equal to the number of empty squares the search is exhaustive and
+    evaluate is never called. radius, if set, only considers moves within
+    that many rows and columns of a piece already on the board. Past the
+    deadline (a time.perf_counter() value) the search raises SearchTimeout.
+    """
+
+    def __init__(
+        self,
+        geometry,
+        table,
+        ordering,
+        evaluate=window_evaluation,
+        radius=None,
+        deadline=None,
+    ):
+        self.geometry = geometry
+        self.table = table
+        self.ordering = ordering
+        self.evaluate = evaluate
+        self.radius = radius
+        self.deadline = deadline
+        self.nodes = 0
+
+    def candidate_moves(self, x_bits, o_bits, empty):
+        geometry = self.geometry
+        occupied = x_bits | o_bits
+        moves = geometry.full & ~occupied
+        if self.radius is not None and occupied:
+            neighborhood = geometry.neighborhood(self.radius)
+            near = 0
+            for square in geometry.squares(occupied):
+                near |= neighborhood[square]
+            moves &= near
+        return self.ordering.order(geometry.squares(moves), empty)
+
+    def move_score(self, x_bits, o_bits, player, square, empty, alpha, beta, depth):
+        """
+        Score of player taking square in the position (x_bits, o_bits), which
+        has empty empty squares: the depth-adjusted win score if it completes
+        a line, 0 if it fills the board, otherwise the score of the reply
+        searched depth - 1 moves deep.
+
+        Returns:
+            int, or float for a heuristic score
+        """
+        self.nodes += 1
+        if (
+            self.deadline is not None
+            and not self.nodes & 255
+            and time.perf_counter() > self.deadline
+        ):
+            raise SearchTimeout
+
+        bit = 1 << square
+        empty -= 1
+        if player == "X":
+            x_bits |= bit
+            if self.geometry.completes_line(x_bits, square):
+                return empty + 1
+        else:
+            o_bits |= bit
+            if self.geometry.completes_line(o_bits, square):
+                return -(empty + 1)
+        if empty == 0:
+            return 0
+        if depth <= 1:
+            return self.evaluate(self.geometry, x_bits, o_bits)
+        other_player = "O" if player == "X" else "X"
+        return self.alphabeta(
+            x_bits, o_bits, other_player, empty, alpha, beta, depth - 1
+        )
+
+    def alphabeta(self, x_bits, o_bits, player, empty, alpha, beta, depth):
+        """
+        Fail-soft alpha-beta score of a position that is not over, with
+        player to move. The result is exact when it lies strictly between
+        alpha and beta; otherwise it is a bound on the same side of the
+        window as it fell. Results are cached under the canonical key, since
+        the score does not change under rotation or reflection, and reused
+        only by a search of the same depth. A depth-limited score is
+        therefore always the plain depth-limited minimax value, whatever the
+        table holds, and searches that share no table still agree. The key
+        includes the evaluation function, so searches with different
+        heuristics never reuse each other's scores.
+
+        Returns:
+            int, or float for a heuristic score
+        """
+        max_player = "X"
+        depth = min(depth, empty)
+        key = (
+            self.geometry,
+            self.geometry.canonical_key(x_bits, o_bits),
+            player,
+            self.radius,
+            self.evaluate,
+        )
+        entry = self.table.get(key)
+        if entry is not None and entry[2] == depth:
+            flag, score, _ = entry
+            if flag == EXACT:
+                return score
+            if flag == LOWER_BOUND:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+        original_alpha, original_beta = alpha, beta
+        best = -math.inf if player == max_player else math.inf
+        for possible_move in self.candidate_moves(x_bits, o_bits, empty):
+            sim_score = self.move_score(
+                x_bits, o_bits, player, possible_move, empty, alpha, beta, depth
+            )
+
+            if player == max_player:
+                if sim_score > best:
+                    best = sim_score
+                    alpha = max(alpha, best)
+            elif sim_score < best:
+                best = sim_score
+                beta = min(beta, best)
+            if alpha >= beta:
+                self.ordering.record_cutoff(possible_move, empty)
+                break
+
+        if best <= original_alpha:
+            self.table.put(key, (UPPER_BOUND, best, depth))
+        elif best >= original_beta:
+            self.table.put(key, (LOWER_BOUND, best, depth))
+        else:
+            self.table.put(key, (EXACT, best, depth))
+        return best
+
+
+def game_over_result(state, player):
+    """
+    The minimax result of a finished game, or None if the game is not over.
+    """
+    max_player = "X"
+    other_player = "O" if player == "X" else "X"
+
+    if state.current_winner == other_player:
+        return {
+            "position": None,
+            "score": (
+                1 * (state.num_empty_squares() + 1)
+                if other_player == max_player
+                else -1 * (state.num_empty_squares() + 1)
+            ),
+        }
+
+    elif not state.empty_squares():
+        return {"position": None, "score": 0}
+
+    return None
+
+
+@instrumented
+def minimax(state, player, table=None, ordering=None, telemetry=None):
+    """
+    Returns the best move for player as {"position": ..., "score": ...}.
+
+    The positions below the root are searched with alpha-beta pruning,
+    trying moves in the order given by ordering (the board's own
+    center-first StaticOrdering if None) and sharing results through table
+    (TRANSPOSITION_TABLE if None). The root keeps the plain minimax rule:
+    the first move in available_moves() order with the best score wins,
+    whatever order the moves are searched in.
+
+    state may be a TicTacToe or a BitboardTicTacToe of any size; either way
+    the search itself runs on the (x_bits, o_bits) integers. The search is
+    exhaustive, so beyond 3x3 use iterative_deepening instead.
+    """
+    if table is None:
+        table = TRANSPOSITION_TABLE
+    if ordering is None:
+        ordering = state.geometry.ordering
+    max_player = "X"
+
+    result = game_over_result(state, player)
+    if result is not None:
+        return result
+
+    if player == max_player:
+        best = {"position": None, "score": -math.inf}
+    else:
+        best = {"position": None, "score": math.inf}
+
+    search = Search(state.geometry, table, ordering)
+    x_bits, o_bits = state.bitboards()
+    empty = state.num_empty_squares()
+    for possible_move in ordering.order(state.available_moves(), empty):
+        # Scores are integers, so widening the window by one lets a move that
+        # comes earlier than the current best be searched exactly for a tie.
+        tie_breaks = best["position"] is None or possible_move < best["position"]
+        if player == max_player:
+            alpha = best["score"] - 1 if tie_breaks else best["score"]
+            beta = math.inf
+        else:
+            alpha = -math.inf
+            beta = best["score"] + 1 if tie_breaks else best["score"]
+
+        sim_score = {
+            "position": possible_move,
+            "score": search.move_score(
+                x_bits, o_bits, player, possible_move, empty, alpha, beta, empty
+            ),
+        }
+
+        if player == max_player:
+            improves = sim_score["score"] > best["score"]
+        else:
+            improves = sim_score["score"] < best["score"]
+        if improves or (tie_breaks and sim_score["score"] == best["score"]):
+            best = sim_score
+
+    if telemetry is not None:
+        telemetry.count("nodes", search.nodes)
+    return best
+
+
+@instrumented
+def iterative_deepening(
+    state,
+    player,
+    time_limit=1.0,
+    max_depth=None,
+    table=None,
+    ordering=None,
+    evaluate=window_evaluation,
+    radius=2,
+    processes=None,
+    telemetry=None,
+):
+    """
+    Searches 1, 2, 3, ... moves ahead until time_limit seconds have passed
+    and returns the best move of the deepest search that finished, as
+    {"position": ..., "score": ..., "depth": ...}.
+
+    Positions still undecided at the depth limit are scored with evaluate,
+    which stays strictly between -1 and 1 so any forced win outranks it.
+    Only moves within radius rows and columns of an existing piece are
+    searched (all moves if radius is None). The first search always runs to
+    completion, so a move is returned however small the budget. The search
+    stops early once it finds a forced result or looks to the end of the
+    game.
+
+    With processes set, each depth splits its root moves across that many
+    worker processes (see parallel_search_root) and picks the same move as
+    the serial search of that depth; telemetry then counts only the nodes
+    searched in this process.
+    """
+    if table is None:
+        table = TRANSPOSITION_TABLE
+    if ordering is None:
+        ordering = state.geometry.ordering
+
+    result = game_over_result(state, player)
+    if result is not None:
+        return dict(result, depth=0)
+
+    deadline = time.perf_counter() + time_limit
+    search = Search(state.geometry, table, ordering, evaluate, radius)
+    x_bits, o_bits = state.bitboards()
+    empty = state.num_empty_squares()
+    moves = search.candidate_moves(x_bits, o_bits, empty)
+    if max_depth is None:
+        max_depth = empty
+
+    best = None
+    with contextlib.ExitStack() as stack:
+        if processes is not None:
+            import multiprocessing
+
+            bound = multiprocessing.Array("d", 2)
+            pool = stack.enter_context(
+                multiprocessing.Pool(processes, init_search_worker, (bound,))
+            )
+        for depth in range(1, min(max_depth, empty) + 1):
+            search.deadline = deadline if best is not None else None
+            nodes = search.nodes
+            try:
+                with phase(telemetry, f"depth {depth}"):
+                    if processes is None:
+                        result = search_root(
+                            search, x_bits, o_bits, player, empty, depth, moves
+                        )
+                    else:
+                        result = parallel_search_root(
+                            pool,
+                            bound,
+                            search,
+                            x_bits,
+                            o_bits,
+                            player,
+                            empty,
+                            depth,
+                            list(enumerate(moves)),
+                        )
+            except SearchTimeout:
+                break
+            finally:
+                if telemetry is not None:
+                    telemetry.count("nodes", search.nodes - nodes)
+            best = dict(result, depth=depth)
+            if telemetry is not None:
+                telemetry.count("depths")
+                telemetry.sample(depth, score=best["score"], position=best["position"])
+            # The best move so far is searched first next time, for more cutoffs.
+            moves = [best["position"]] + [m for m in moves if m != best["position"]]
+            if abs(best["score"]) >= 1 or time.perf_counter() >= deadline:
+                break
+    return best
+
+
+def search_root(search, x_bits, o_bits, player, empty, depth, moves):
+    """
+    Scores moves in the given order, depth moves deep, and returns the first
+    best one as {"position": ..., "score": ...}.
+    """
+    max_player = "X"
+    alpha, beta = -math.inf, math.inf
+    best = None
+    for possible_move in moves:
+        score = search.move_score(
+            x_bits, o_bits, player, possible_move, empty, alpha, beta, depth
+        )
+        if player == max_player:
+            if best is None or score > best["score"]:
+                best = {"position": possible_move, "score": score}
+                alpha = max(alpha, score)
+        elif best is None or score < best["score"]:
+            best = {"position": possible_move, "score": score}
+            beta = min(beta, score)
+    return best
+
+
+# Best (score, rank) found so far at the root, shared by the worker processes
+# of a parallel search. Set in each worker by init_search_worker.
+worker_bound = None
+
+
+def init_search_worker(bound):
+    global worker_bound
+    worker_bound = bound
+
+
+def improves(player, score, rank, best_score, best_rank):
+    """
+    Returns True if a root move with score and rank beats the best so far:
+    a better score, or the same score and an earlier rank.
+    """
+    if score == best_score:
+        return rank < best_rank
+    return score > best_score if player == "X" else score < best_score
+
+
+def root_window(player, best_score, best_rank, rank):
+    """
+    Alpha-beta window for the root move of the given rank once the best
+    move so far has best_score and best_rank. A move that ranks earlier wins
+    a tie, so its window reaches just past best_score to tell a tie apart
+    from a worse score.
+
+    Returns:
+        tuple of (alpha, beta)
+    """
+    if player == "X":
+        if rank < best_rank:
+            return math.nextafter(best_score, -math.inf), math.inf
+        return best_score, math.inf
+    if rank < best_rank:
+        return -math.inf, math.nextafter(best_score, math.inf)
+    return -math.inf, best_score
+
+
+def search_root_task(task):
+    """
+    Scores one root move in a worker process, against the best bound any
+    worker has published so far, and publishes the score if it is exact and
+    better.
+
+    Returns:
+        (rank, square, score, alpha, beta), or None if the deadline passed
+    """
+    (
+        geometry,
+        x_bits,
+        o_bits,
+        player,
+        rank,
+        square,
+        empty,
+        depth,
+        evaluate,
+        radius,
+        deadline,
+    ) = task
+    with worker_bound.get_lock():
+        best_score, best_rank = worker_bound[0], worker_bound[1]
+    alpha, beta = root_window(player, best_score, best_rank, rank)
+    search = Search(
+        geometry, TRANSPOSITION_TABLE, geometry.ordering, evaluate, radius, deadline
+    )
+    try:
+        score = search.move_score(
+            x_bits, o_bits, player, square, empty, alpha, beta, depth
+        )
+    except SearchTimeout:
+        return None
+    if alpha < score < beta:
+        with worker_bound.get_lock():
+            if improves(player, score, rank, worker_bound[0], worker_bound[1]):
+                worker_bound[0], worker_bound[1] = score, rank
+    return rank, square, score, alpha, beta
+
+
+def parallel_search_root(
+    pool, bound, search, x_bits, o_bits, player, empty, depth, ranked_moves
+):
+    """
+    Scores the root moves, given as (rank, square) pairs in search order,
+    depth moves deep, and returns the best one, the earliest ranked on ties,
+    as {"position": ..., "score": ...}.
+
+    The first move is searched here with a full window (young brothers
+    wait), then the rest go to pool, whose workers share the best bound
+    through the bound array set up by init_search_worker. A move searched
+    with a window it fell outside of is provably not the best, so the
+    result is the one a serial search would find.
+    """
+    first_rank, first_square = ranked_moves[0]
+    score = search.move_score(
+        x_bits, o_bits, player, first_square, empty, -math.inf, math.inf, depth
+    )
+    results = [(first_rank, first_square, score, -math.inf, math.inf)]
+    with bound.get_lock():
+        bound[0], bound[1] = score, first_rank
+
+    tasks = [
+        (
+            search.geometry,
+            x_bits,
+            o_bits,
+            player,
+            rank,
+            square,
+            empty,
+            depth,
+            search.evaluate,
+            search.radius,
+            search.deadline,
+        )
+        for rank, square in ranked_moves[1:]
+    ]
+    for result in pool.imap_unordered(search_root_task, tasks):
+        if result is None:
+            raise SearchTimeout
+        results.append(result)
+
+    best = None
+    for rank, square, score, alpha, beta in results:
+        if alpha < score < beta and (
+            best is None or improves(player, score, rank, best[0], best[1])
+        ):
+            best = (score, rank, square)
+    return {"position": best[2], "score": best[0]}
+
+
+def parallel_minimax(state, player, processes=None):
+    """
+    minimax with the root moves split across processes worker processes
+    (one per CPU if None). Returns the same move and score as
+    minimax(state, player).
+    """
+    result = game_over_result(state, player)
+    if result is not None:
+        return result
+
+    geometry = state.geometry
+    search = Search(geometry, TRANSPOSITION_TABLE, geometry.ordering)
+    x_bits, o_bits = state.bitboards()
+    empty = state.num_empty_squares()
+    # minimax breaks ties by square, whatever order the moves are searched in.
+    ranked_moves = [
+        (square, square)
+        for square in geometry.ordering.order(state.available_moves(), empty)
+    ]
+    import multiprocessing
+
+    bound = multiprocessing.Array("d", 2)
+    with multiprocessing.Pool(processes, init_search_worker, (bound,)) as pool:
+        return parallel_search_root(
+            pool, bound, search, x_bits, o_bits, player, empty, empty, ranked_moves
+        )
@@ -0,0 +1,111 @@
+"""
+Fixtures shared by the tic-tac-toe tests: every reachable 3x3 position, and
+the minimax of the original tic-tac-toe.py to check the engines against.
+"""
+from functools import lru_cache
+
+import pytest
+
+LINES = [
+    (0, 1, 2),
+    (3, 4, 5),
+    (6, 7, 8),
+    (0, 3, 6),
+    (1, 4, 7),
+    (2, 5, 8),
+    (0, 4, 8),
+    (2, 4, 6),
+]
+
+
+def has_won(board, letter):
+    return any(all(board[square] == letter for square in line) for line in LINES)
+
+
+def is_over(board):
+    return has_won(board, "X") or has_won(board, "O") or " " not in board
+
+
+@lru_cache(maxsize=None)
+def reference_minimax(board, player):
+    """
+    The original minimax, on a tuple board whose game is not over. It is
+    memoized so that every position can be checked in reasonable time; the
+    move and score it picks are unchanged.
+
+    Returns:
+        dict with "position" and "score"
+    """
+    other_player = "O" if player == "X" else "X"
+    best = {
+        "position": None,
+        "score": -float("inf") if player == "X" else float("inf"),
+    }
+    for square in range(9):
+        if board[square] != " ":
+            continue
+        child = board[:square] + (player,) + board[square + 1 :]
+        empty = child.count(" ")
+        if has_won(child, player):
+            score = empty + 1 if player == "X" else -(empty + 1)
+        elif not empty:
+            score = 0
+        else:
+            score = reference_minimax(child, other_player)["score"]
+        if (player == "X" and score > best["score"]) or (
+            player == "O" and score < best["score"]
+        ):
+            best = {"position": square, "score": score}
+    return best
+
+
+@pytest.fixture(scope="session")
+def positions():
+    """
+    Every position a 3x3 game can reach, finished or not, as (board,
+    player to move) pairs with the board a tuple of "X", "O" and " ".
+    """
+    start = (tuple(" " * 9), "X")
+    seen = {start}
+    frontier = [start]
+    while frontier:
+        board, player = frontier.pop()
+        if is_over(board):
+            continue
+        for square in range(9):
+            if board[square] == " ":
+                child = board[:square] + (player,) + board[square + 1 :]
+                position = (child, "O" if player == "X" else "X")
+                if position not in seen:
+                    seen.add(position)
+                    frontier.append(position)
+    return sorted(seen)
+
+
+@pytest.fixture(scope="session")
+def open_positions(positions):
+    """
+    The reachable 3x3 positions whose game is not over yet.
+    """
+    return [(board, player) for board, player in positions if not is_over(board)]
+
+
+@pytest.fixture(scope="session")
+def reference():
+    return reference_minimax
+
+
+@pytest.fixture
+def make_state():
+    """
+    Builds a board of the given class holding the pieces of a tuple board.
+    """
+
+    def make_state(board_class, board, rows=3, cols=3, k=3):
+        state = board_class(rows, cols, k)
+        for square, letter in enumerate(board):
+            if letter != " ":
+                state.make_move(square, letter)
+        return state
+
+    return make_state
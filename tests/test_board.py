@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from comp469.tictactoe.board import BitboardTicTacToe, TicTacToe
+from comp469.tictactoe.geometry import board_geometry
+from comp469.tictactoe.search import TranspositionTable, minimax
+
+
+def test_win_masks_are_the_eight_lines():
+    geometry = board_geometry(3, 3, 3)
+    assert sorted(geometry.win_lines) == [
+        (0, 1, 2),
+        (0, 3, 6),
+        (0, 4, 8),
+        (1, 4, 7),
+        (2, 4, 6),
+        (2, 5, 8),
+        (3, 4, 5),
+        (6, 7, 8),
+    ]
+    assert geometry.win_masks == tuple(
+        sum(1 << square for square in line) for line in geometry.win_lines
+    )
+
+
+@pytest.mark.parametrize("rows, cols, k", [(3, 3, 3), (4, 4, 3), (5, 5, 4), (3, 6, 3)])
+def test_bitboard_board_behaves_like_the_list_board(rows, cols, k):
+    rng = random.Random(rows * cols + k)
+    for _ in range(50):
+        boards = [TicTacToe(rows, cols, k), BitboardTicTacToe(rows, cols, k)]
+        letter = "X"
+        while boards[0].empty_squares() and not boards[0].current_winner:
+            square = rng.choice(boards[0].available_moves())
+            for board in boards:
+                assert board.make_move(square, letter)
+                assert not board.make_move(square, letter)
+            letter = "O" if letter == "X" else "X"
+            listed, bitboard = boards
+            assert bitboard.board == listed.board
+            assert bitboard.bitboards() == listed.bitboards()
+            assert bitboard.available_moves() == listed.available_moves()
+            assert bitboard.num_empty_squares() == listed.num_empty_squares()
+            assert bitboard.empty_squares() == listed.empty_squares()
+            assert bitboard.current_winner == listed.current_winner
+        for board in boards:
+            board.undo_move(square)
+        assert boards[1].board == boards[0].board
+        assert boards[1].current_winner is boards[0].current_winner is None
+
+
+def test_bitboard_minimax_matches_reference(open_positions, reference, make_state):
+    table = TranspositionTable()
+    for board, player in open_positions:
+        state = make_state(BitboardTicTacToe, board)
+        assert minimax(state, player, table) == reference(board, player)
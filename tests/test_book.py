@@ -0,0 +1,65 @@
+import multiprocessing
+
+from comp469.tictactoe.board import TicTacToe
+from comp469.tictactoe.book import (
+    best_move,
+    book_move,
+    load_opening_book,
+    opening_book,
+    solve_game,
+    write_opening_book,
+)
+
+
+def test_book_matches_reference(tmp_path, open_positions, reference, make_state):
+    book = opening_book(str(tmp_path / "book.bin"))
+    for board, player in open_positions:
+        state = make_state(TicTacToe, board)
+        assert book_move(book, state, player) == reference(board, player)
+
+
+def test_book_is_built_once_and_saved(tmp_path):
+    path = str(tmp_path / "cache" / "book.bin")
+    book = opening_book(path)
+    assert len(book) == 627
+    assert load_opening_book(path) == book
+    assert opening_book(path) is book
+
+
+def test_bad_book_is_solved_again(tmp_path):
+    path = tmp_path / "book.bin"
+    path.write_bytes(b"TTTBOOK1")
+    book = opening_book(str(path))
+    assert book == {key: tuple(scores) for key, scores in solve_game().items()}
+    assert load_opening_book(str(path)) == book
+
+
+def test_book_works_without_a_writable_cache(tmp_path):
+    (tmp_path / "file").write_text("")
+    path = str(tmp_path / "file" / "book.bin")
+    assert len(opening_book(path)) == 627
+
+
+def write_and_read_book(path):
+    book = {key: tuple(scores) for key, scores in solve_game().items()}
+    for _ in range(10):
+        write_opening_book(book, path)
+        assert load_opening_book(path) == book
+
+
+def test_concurrent_writers_never_expose_a_partial_book(tmp_path):
+    path = str(tmp_path / "book.bin")
+    with multiprocessing.Pool(4) as pool:
+        pool.map(write_and_read_book, [path] * 4)
+    assert [p.name for p in tmp_path.iterdir()] == ["book.bin"]
+
+
+def test_best_move_falls_back_to_search(tmp_path):
+    path = str(tmp_path / "book.bin")
+    state = TicTacToe()
+    state.make_move(4, "X")
+    # Not X's turn, so the book has no answer and minimax gives one.
+    assert book_move(opening_book(path), state, "X") is None
+    assert best_move(state, "X", book_path=path)["position"] is not None
+    assert book_move(opening_book(path), TicTacToe(4, 4, 4), "X") is None
+    assert best_move(TicTacToe(4, 4, 4), "X", time_limit=0.05)["position"] in range(16)
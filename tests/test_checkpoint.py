@@ -0,0 +1,158 @@
+import os
+import random
+
+import pytest
+
+from comp469.nqueens import annealing
+from comp469.nqueens.annealing import (
+    measure_performance_simulated_annealing,
+    resume_simulated_annealing,
+    simulated_annealing,
+    simulated_annealing_stream,
+)
+from comp469.nqueens.board import create_board, place_queens
+from comp469.nqueens.checkpoint import (
+    AnnealingCheckpoint,
+    GeneticCheckpoint,
+    load_checkpoint,
+    run_batch,
+    run_checkpoint_path,
+    save_checkpoint,
+)
+from comp469.nqueens.genetic import (
+    genetic_algorithm_stream,
+    optimized_genetic_algorithm,
+    resume_genetic_algorithm,
+)
+from comp469.streaming import run_stream
+
+
+class Interrupted(Exception):
+    pass
+
+
+def random_board(rng):
+    return place_queens(create_board(), rng)
+
+
+def stop_after(iterations):
+    return lambda snapshot: snapshot.iteration >= iterations
+
+
+def test_checkpoints_round_trip(tmp_path):
+    path = str(tmp_path / "run.ckpt")
+    rng = random.Random(0)
+    rng.gauss(0, 1)
+    checkpoint = AnnealingCheckpoint(
+        120, None, 3.5, 0.95, random_board(rng), rng.getstate()
+    )
+    save_checkpoint(path, checkpoint)
+    assert load_checkpoint(path) == checkpoint
+
+    population = [random_board(rng) for _ in range(7)]
+    checkpoint = GeneticCheckpoint(40, 500, 0.05, "sus", population, rng.getstate())
+    save_checkpoint(path, checkpoint)
+    assert load_checkpoint(path) == checkpoint
+    assert os.listdir(tmp_path) == ["run.ckpt"]
+
+
+def test_bad_checkpoints_are_rejected(tmp_path):
+    path = tmp_path / "run.ckpt"
+    path.write_bytes(b"NOTACKPT" + bytes(5000))
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
+    rng = random.Random(1)
+    save_checkpoint(
+        str(path),
+        AnnealingCheckpoint(1, 10, 1.0, 0.9, random_board(rng), rng.getstate()),
+    )
+    path.write_bytes(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
+    with pytest.raises(ValueError):
+        simulated_annealing(
+            random_board(rng), checkpoint_path=str(path), checkpoint_every=0
+        )
+
+
+def test_resumed_annealing_matches_uninterrupted(tmp_path):
+    path = str(tmp_path / "annealing.ckpt")
+    board = random_board(random.Random(1))
+    options = {"max_steps": 500, "initial_temp": 100.0, "cooling_rate": 0.99}
+    expected = simulated_annealing(
+        [row[:] for row in board], rng=random.Random(2), **options
+    )
+    stream = simulated_annealing_stream(
+        [row[:] for row in board],
+        checkpoint_path=path,
+        checkpoint_every=50,
+        rng=random.Random(2),
+        **options,
+    )
+    result, _ = run_stream(stream, stop_after(120))
+    assert result is None
+    assert resume_simulated_annealing(path, rng=random.Random()) == expected
+
+
+def test_resumed_genetic_algorithm_matches_uninterrupted(tmp_path):
+    path = str(tmp_path / "genetic.ckpt")
+    options = {"population_size": 20, "max_generations": 60, "selection": "sus"}
+    expected = optimized_genetic_algorithm(rng=random.Random(3), **options)
+    stream = genetic_algorithm_stream(
+        checkpoint_path=path, checkpoint_every=5, rng=random.Random(3), **options
+    )
+    result, _ = run_stream(stream, stop_after(23))
+    assert result is None
+    assert resume_genetic_algorithm(path, rng=random.Random()) == expected
+
+
+def test_run_batch_carries_on_from_the_run_it_was_in(tmp_path):
+    path = str(tmp_path / "batch")
+    calls = []
+
+    def start_run(index, run_path):
+        calls.append(("start", index))
+        with open(run_path, "wb"):
+            pass
+        if calls == [("start", 0), ("start", 1), ("start", 2)]:
+            raise Interrupted
+        return None, index % 2
+
+    def resume_run(index, run_path):
+        calls.append(("resume", index))
+        return None, index % 2
+
+    with pytest.raises(Interrupted):
+        run_batch(start_run, resume_run, 5, path, resume=True)
+    assert os.path.exists(run_checkpoint_path(path, 2))
+    # Runs 0, 2 and 4 find a solution.
+    assert run_batch(start_run, resume_run, 5, path, resume=True) == 3
+    assert calls[3:] == [("resume", 2), ("start", 3), ("start", 4)]
+    assert os.listdir(tmp_path) == []
+    # Without a path there is nothing to resume.
+    assert run_batch(lambda *args: (None, 0), None, 2, resume=True) == 2
+
+
+def test_interrupted_batch_resumes_to_the_same_result(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    options = {"runs": 4, "seed": 9, "checkpoint_every": 20, "max_steps": 200}
+    expected = measure_performance_simulated_annealing(**options)[1]
+    path = str(tmp_path / "batch")
+    saves = []
+
+    def save_then_stop(checkpoint_path, checkpoint):
+        save_checkpoint(checkpoint_path, checkpoint)
+        saves.append(checkpoint_path)
+        if len(saves) == 12:
+            raise Interrupted
+
+    monkeypatch.setattr(annealing, "save_checkpoint", save_then_stop)
+    with pytest.raises(Interrupted):
+        measure_performance_simulated_annealing(checkpoint_path=path, **options)
+    monkeypatch.undo()
+    assert saves[0] != saves[-1]
+    _, success_rate = measure_performance_simulated_annealing(
+        checkpoint_path=path, resume=True, **options
+    )
+    assert success_rate == expected
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,60 @@
+import pytest
+
+from comp469.tictactoe.game import arena, main, percentile, play_headless
+from comp469.tictactoe.players import RandomPlayer
+
+
+def test_headless_games_replay_from_their_seed():
+    games = [
+        play_headless(RandomPlayer(), RandomPlayer(), 4, 4, 3, seed=5)
+        for _ in range(2)
+    ]
+    assert games[0]["moves"] == games[1]["moves"]
+    assert games[0]["winner"] == games[1]["winner"]
+    moves = games[0]["moves"]
+    assert len(set(moves)) == len(moves)
+    latencies = games[0]["latencies"]
+    assert len(latencies["X"]) + len(latencies["O"]) == len(moves)
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 11))
+    assert percentile(values, 0.5) == 5
+    assert percentile(values, 0.9) == 9
+    assert percentile(values, 0.99) == 10
+    assert percentile(values, 0) == 1
+    assert percentile([], 0.5) is None
+
+
+def test_arena_reports_outcomes_and_latencies():
+    report = arena(RandomPlayer(), RandomPlayer(), games=40, seed=1)
+    assert report["games"] == 40
+    assert sum(report["outcomes"].values()) == 40
+    assert report["games_per_second"] > 0
+    moves = report["move_latency"]["X"]["moves"] + report["move_latency"]["O"]["moves"]
+    assert moves == report["mean_moves"] * 40
+    stats = report["move_latency"]["X"]
+    assert stats["p50"] <= stats["p90"] <= stats["p99"] <= stats["max"]
+
+
+def test_parallel_arena_plays_the_same_games():
+    serial = arena(RandomPlayer(), RandomPlayer(), games=30, rows=4, cols=4, seed=2)
+    parallel = arena(
+        RandomPlayer(), RandomPlayer(), games=30, rows=4, cols=4, processes=2, seed=2
+    )
+    assert parallel["outcomes"] == serial["outcomes"]
+    assert parallel["mean_moves"] == serial["mean_moves"]
+
+
+def test_arena_needs_a_game():
+    with pytest.raises(ValueError):
+        arena(RandomPlayer(), RandomPlayer(), games=0)
+    with pytest.raises(SystemExit):
+        main(["--arena", "0", "-x", "random", "-o", "random"])
+
+
+def test_arena_command(capsys):
+    main(["--arena", "5", "-x", "random", "-o", "random", "--rows", "4", "--cols", "4"])
+    output = capsys.readouterr().out
+    assert output.startswith("5 games in ")
+    assert "X move latency over" in output
@@ -0,0 +1,74 @@
+import random
+from collections import Counter
+
+import pytest
+
+from comp469.nqueens.board import get_attacking_pairs
+from comp469.nqueens.genetic import (
+    SELECTION_METHODS,
+    argsort,
+    optimized_genetic_algorithm,
+    optimized_get_attacking_pairs,
+    rank_selection,
+    roulette_selection,
+    stochastic_universal_selection,
+)
+
+
+@pytest.mark.parametrize("selection", sorted(SELECTION_METHODS))
+def test_selection_returns_count_indices(selection):
+    select = SELECTION_METHODS[selection]
+    fitness_values = [1 / (1 + i % 7) for i in range(30)]
+    for count in (0, 1, 2, 57):
+        indices = select(fitness_values, count, rng=random.Random(count))
+        assert len(indices) == count
+        assert all(index in range(30) for index in indices)
+
+
+def test_roulette_selection_is_fitness_proportionate():
+    picks = Counter(roulette_selection([1, 3], 8000, rng=random.Random(0)))
+    assert 5700 < picks[1] < 6300
+
+
+def test_stochastic_universal_selection_keeps_close_to_each_share():
+    fitness_values = [0.1, 0.5, 0.2, 1.0, 0.05, 0.15]
+    count = 40
+    total = sum(fitness_values)
+    for seed in range(20):
+        picks = Counter(
+            stochastic_universal_selection(fitness_values, count, random.Random(seed))
+        )
+        for index, fitness in enumerate(fitness_values):
+            share = fitness / total * count
+            assert share - 1 < picks[index] < share + 1
+
+
+def test_stochastic_universal_selection_shuffles_its_picks():
+    indices = stochastic_universal_selection([1] * 20, 20, random.Random(1))
+    assert sorted(indices) == list(range(20))
+    assert indices != sorted(indices)
+
+
+def test_rank_selection_ignores_how_far_apart_fitness_values_are():
+    picks = Counter(rank_selection([0.001, 0.002, 1000], 6000, rng=random.Random(0)))
+    # Ranks 1, 2 and 3 out of 6, whatever the fitness values.
+    assert 2700 < picks[2] < 3300
+    assert 700 < picks[0] < 1300
+
+
+def test_argsort_orders_ties_by_index():
+    assert argsort([0.5, 1.0, 0.5]) == [0, 2, 1]
+    assert argsort([0.5, 1.0, 0.5], reverse=True) == [1, 0, 2]
+
+
+@pytest.mark.parametrize("selection", sorted(SELECTION_METHODS))
+def test_genetic_algorithm_with_each_selection(selection):
+    board, attacks = optimized_genetic_algorithm(
+        population_size=30,
+        max_generations=20,
+        selection=selection,
+        rng=random.Random(4),
+    )
+    assert all(sum(row[col] for row in board) == 1 for col in range(8))
+    assert attacks == get_attacking_pairs(board)
+    assert attacks == optimized_get_attacking_pairs(board)
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from comp469.tictactoe.board import BitboardTicTacToe
+from comp469.tictactoe.mcts import MCTSPlayer
+
+
+def play(rows, cols, k, x_squares, o_squares):
+    state = BitboardTicTacToe(rows, cols, k)
+    for square in x_squares:
+        state.make_move(square, "X")
+    for square in o_squares:
+        state.make_move(square, "O")
+    return state
+
+
+def test_mcts_needs_a_budget():
+    with pytest.raises(ValueError):
+        MCTSPlayer(playouts=None, time_limit=None)
+
+
+def test_mcts_runs_its_playout_budget_and_takes_a_win():
+    state = play(5, 5, 4, [6, 7, 8], [0, 20, 24])
+    result = MCTSPlayer(playouts=2000, seed=0).get_move(state, "X")
+    assert result["playouts"] == 2000
+    assert result["position"] in (5, 9)
+    assert result["score"] > 0
+
+
+def test_mcts_is_replayable_from_its_seed():
+    state = play(4, 4, 3, [5], [6])
+    moves = [MCTSPlayer(playouts=300, seed=7).get_move(state, "X") for _ in range(2)]
+    assert moves[0] == moves[1]
+
+
+def test_mcts_reuses_the_tree_between_moves():
+    player = MCTSPlayer(playouts=500, seed=1)
+    state = BitboardTicTacToe(4, 4, 3)
+    state.make_move(player.get_move(state, "X")["position"], "X")
+    reply = max(player.root.children, key=lambda child: child.visits)
+    learned = reply.visits
+    state.make_move(reply.move, "O")
+    assert learned > 0
+    assert player.get_move(state, "X")["playouts"] == 500 + learned
+
+
+def test_mcts_runs_on_a_time_budget_alone():
+    player = MCTSPlayer(playouts=None, time_limit=0.05, seed=2)
+    start = time.perf_counter()
+    result = player.get_move(BitboardTicTacToe(7, 7, 5), "X")
+    assert time.perf_counter() - start < 1
+    assert result["playouts"] >= 1
+    assert result["position"] in range(49)
+
+
+@pytest.mark.parametrize("playouts, time_limit", [(400, None), (None, 0.1)])
+def test_parallel_mcts(playouts, time_limit):
+    state = play(5, 5, 4, [6, 7, 8], [0, 20, 24])
+    with MCTSPlayer(playouts, time_limit, processes=2, seed=3) as player:
+        result = player.get_move(state, "X")
+    if playouts is not None:
+        assert result["playouts"] == playouts
+    assert result["playouts"] >= 2
+    assert result["position"] in (5, 9)
+
+
+def test_mcts_on_a_finished_game():
+    state = play(3, 3, 3, [0, 1, 2], [3, 4])
+    result = MCTSPlayer(playouts=10).get_move(state, "O")
+    assert result == {"position": None, "score": 5, "playouts": 0}
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import comp469
+from comp469 import cli, puzzle
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(*args, cwd=None):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+
+
+def test_import_does_no_work():
+    code = (
+        "import sys, comp469, comp469.puzzle, comp469.nqueens, comp469.tictactoe; "
+        "print(' '.join(sorted(sys.modules)))"
+    )
+    modules = run_python("-c", code).split()
+    assert "networkx" not in modules
+    assert "numpy" not in modules
+    assert "comp469.statespace" not in modules
+
+
+def test_submodules_load_on_first_access():
+    assert comp469.streaming.Snapshot._fields == (
+        "iteration",
+        "best_cost",
+        "best_board",
+    )
+    with pytest.raises(AttributeError):
+        comp469.no_such_module
+
+
+def test_cli_runs_from_any_directory(tmp_path):
+    output = run_python("-m", "comp469", "hill-climb", "--runs", "2", cwd=tmp_path)
+    assert output.startswith("Hill-Climbing Performance:")
+
+
+def test_cli_rejects_unknown_commands_and_searches():
+    with pytest.raises(SystemExit):
+        cli.main(["no-such-command"])
+    with pytest.raises(SystemExit):
+        puzzle.main(["no_such_search"])
+
+
+def test_puzzle_runs_every_search_by_default(capsys):
+    cli.main(["puzzle"])
+    output = capsys.readouterr().out
+    for name in puzzle.ALGORITHMS.values():
+        assert f"{name} Performance:" in output
@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from comp469.nqueens import annealing, genetic, hill_climbing
+from comp469.nqueens.annealing import get_random_neighbor, simulated_annealing
+from comp469.nqueens.board import create_board, place_queens
+from comp469.nqueens.genetic import (
+    SELECTION_METHODS,
+    mutate,
+    optimized_genetic_algorithm,
+    reproduce,
+)
+from comp469.rng import run_rng, spawn_rngs
+
+
+def test_run_rng_is_the_spawned_seed_sequence_stream():
+    numpy = pytest.importorskip("numpy")
+    children = numpy.random.SeedSequence(1234).spawn(5)
+    for index, child in enumerate(children):
+        words = child.generate_state(4)
+        seed = sum(int(word) << (32 * i) for i, word in enumerate(words))
+        assert run_rng(1234, index).getstate() == random.Random(seed).getstate()
+    streams = spawn_rngs(1234, 5)
+    assert [rng.getstate() for rng in streams] == [
+        run_rng(1234, index).getstate() for index in range(5)
+    ]
+    assert len({rng.random() for rng in streams}) == 5
+
+
+def draw_everything(rng):
+    board = place_queens(create_board(), rng)
+    other = place_queens(create_board(), rng)
+    fitness_values = [rng.random() for _ in range(10)]
+    return (
+        board,
+        get_random_neighbor(board, rng),
+        mutate(reproduce(board, other, rng), rng),
+        [select(fitness_values, 6, rng=rng) for select in SELECTION_METHODS.values()],
+        simulated_annealing(board, max_steps=200, rng=rng),
+        optimized_genetic_algorithm(population_size=10, max_generations=5, rng=rng),
+    )
+
+
+def test_solvers_replay_from_their_generator_alone():
+    random.seed(0)
+    global_state = random.getstate()
+    first = draw_everything(random.Random(42))
+    assert random.getstate() == global_state
+    random.seed(1)
+    assert draw_everything(random.Random(42)) == first
+
+
+@pytest.mark.parametrize(
+    "module, argv",
+    [
+        (annealing, ["--runs", "3"]),
+        (hill_climbing, ["--runs", "3"]),
+        (genetic, ["--runs", "2", "--population-size", "10"]),
+    ],
+)
+def test_seeded_commands_replay(module, argv, capsys):
+    pytest.importorskip("numpy")
+    outputs = []
+    for global_seed in (0, 1):
+        random.seed(global_seed)
+        module.main(argv + ["--seed", "5"])
+        lines = capsys.readouterr().out.splitlines()
+        outputs.append([line for line in lines if "Time =" not in line])
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,240 @@
+import random
+
+import pytest
+
+from comp469.telemetry import Telemetry
+from comp469.tictactoe.board import TicTacToe
+from comp469.tictactoe.geometry import BoardGeometry, board_geometry
+from comp469.tictactoe.ordering import (
+    KillerHistoryOrdering,
+    MoveOrdering,
+    StaticOrdering,
+)
+from comp469.tictactoe.search import (
+    TranspositionTable,
+    iterative_deepening,
+    minimax,
+    parallel_minimax,
+    window_evaluation,
+)
+
+
+def random_position(rng, rows, cols, k, moves):
+    """
+    Plays up to moves random moves from an empty board, stopping short of
+    any move that would end the game.
+
+    Returns:
+        tuple of the board and the player to move
+    """
+    state = TicTacToe(rows, cols, k)
+    player = "X"
+    for _ in range(moves):
+        square = rng.choice(state.available_moves())
+        state.make_move(square, player)
+        if state.current_winner:
+            state.undo_move(square)
+            break
+        player = "O" if player == "X" else "X"
+    return state, player
+
+
+def test_reachable_positions(positions, open_positions):
+    assert len(positions) == 5478
+    assert len(open_positions) == 4520
+
+
+def test_canonical_keys_identify_symmetric_positions(positions, make_state):
+    geometry = board_geometry(3, 3, 3)
+    keys = {
+        geometry.canonical_key(*make_state(TicTacToe, board).bitboards())
+        for board, _ in positions
+    }
+    assert len(keys) == 765
+
+
+@pytest.mark.parametrize("rows, cols, k", [(3, 3, 3), (4, 4, 3), (3, 5, 3)])
+def test_canonical_key_is_the_same_under_every_symmetry(rows, cols, k):
+    geometry = board_geometry(rows, cols, k)
+    rng = random.Random(rows * cols)
+    for _ in range(20):
+        state, _ = random_position(rng, rows, cols, k, rng.randrange(rows * cols))
+        key = geometry.canonical_key(*state.bitboards())
+        for perm in geometry.symmetries:
+            moved = TicTacToe(rows, cols, k)
+            moved.board = [state.board[i] for i in perm]
+            assert geometry.canonical_key(*moved.bitboards()) == key
+
+
+def test_transposition_table_evicts_least_recently_used():
+    table = TranspositionTable(max_size=2)
+    table.put("a", 1)
+    table.put("b", 2)
+    table.get("a")
+    table.put("c", 3)
+    assert len(table) == 2
+    assert table.get("b") is None
+    assert table.get("a") == 1
+    assert table.get("c") == 3
+
+
+def test_minimax_matches_reference(open_positions, reference, make_state):
+    # One table for every position, as the engine shares it between moves.
+    table = TranspositionTable()
+    for board, player in open_positions:
+        state = make_state(TicTacToe, board)
+        assert minimax(state, player, table) == reference(board, player)
+
+
+def test_minimax_reuses_the_table_between_calls():
+    table = TranspositionTable()
+    first = minimax(TicTacToe(), "X", table)
+    hits = table.hits
+    assert minimax(TicTacToe(), "X", table) == first
+    assert table.hits > hits
+    # A tiny table evicts almost everything but gives the same answer.
+    assert minimax(TicTacToe(), "X", TranspositionTable(max_size=1)) == first
+
+
+@pytest.mark.parametrize(
+    "ordering", [MoveOrdering, StaticOrdering, KillerHistoryOrdering]
+)
+def test_move_ordering_keeps_the_reference_move(
+    ordering, open_positions, reference, make_state
+):
+    table = TranspositionTable()
+    ordering = ordering()
+    for board, player in open_positions:
+        state = make_state(TicTacToe, board)
+        result = minimax(state, player, table, ordering)
+        assert result == reference(board, player)
+
+
+def test_static_ordering_tries_center_then_corners_then_edges():
+    assert StaticOrdering().order(range(9), 9) == [4, 0, 2, 6, 8, 1, 3, 5, 7]
+
+
+def test_killer_history_ordering_tries_killers_first():
+    ordering = KillerHistoryOrdering()
+    ordering.record_cutoff(7, 5)
+    ordering.record_cutoff(1, 5)
+    assert ordering.order(range(9), 5)[:2] == [1, 7]
+    # Elsewhere the cutoffs only count through the history.
+    assert ordering.order([3, 5, 7, 4], 6) == [7, 4, 3, 5]
+
+
+def test_alpha_beta_prunes_the_full_tree():
+    # The unpruned tree below the empty board has 549,945 nodes. A table
+    # of size 0 caches nothing, so only pruning can save nodes.
+    for ordering in (MoveOrdering(), StaticOrdering()):
+        telemetry = Telemetry("minimax")
+        result = minimax(
+            TicTacToe(),
+            "X",
+            TranspositionTable(max_size=0),
+            ordering,
+            telemetry=telemetry,
+        )
+        assert result == {"position": 0, "score": 0}
+        assert telemetry.counters["nodes"] < 549945 // 10
+
+
+def test_board_size_and_win_length_are_parameters():
+    state = TicTacToe(5, 5, 4)
+    for square in (0, 6, 12):
+        state.make_move(square, "X")
+    assert state.current_winner is None
+    state.make_move(18, "X")
+    assert state.current_winner == "X"
+    with pytest.raises(ValueError):
+        BoardGeometry(3, 3, 4)
+
+
+def play(rows, cols, k, x_squares, o_squares):
+    state = TicTacToe(rows, cols, k)
+    for square in x_squares:
+        state.make_move(square, "X")
+    for square in o_squares:
+        state.make_move(square, "O")
+    return state
+
+
+def test_iterative_deepening_takes_a_win_and_blocks_a_loss():
+    # X to move with three in a row open at both ends, on 5x5 with 4 to win.
+    state = play(5, 5, 4, [6, 7, 8], [0, 20, 24])
+    result = iterative_deepening(state, "X", time_limit=5)
+    assert result["position"] in (5, 9)
+    assert result["score"] > 1
+    # O to move must block X's three on a 4x4 board with 4 to win.
+    state = play(4, 4, 4, [0, 5, 10], [1, 2])
+    assert iterative_deepening(state, "O", time_limit=5)["position"] == 15
+
+
+def test_iterative_deepening_respects_its_budgets():
+    state = play(5, 5, 4, [12], [6])
+    result = iterative_deepening(state, "X", time_limit=60, max_depth=2)
+    assert result["depth"] == 2
+    assert -1 < result["score"] < 1
+    # However small the time limit, the first depth always completes.
+    result = iterative_deepening(TicTacToe(7, 7, 5), "X", time_limit=0)
+    assert result["depth"] >= 1
+    assert result["position"] in range(49)
+
+
+def test_exhaustive_iterative_deepening_scores_like_minimax(
+    open_positions, reference, make_state
+):
+    table = TranspositionTable()
+    for board, player in open_positions:
+        state = make_state(TicTacToe, board)
+        result = iterative_deepening(
+            state, player, time_limit=60, radius=None, table=table
+        )
+        assert result["score"] == reference(board, player)["score"]
+
+
+def test_searches_with_different_evaluations_share_a_table_safely():
+    state = play(5, 5, 4, [12, 13], [7])
+
+    def flat_evaluation(geometry, x_bits, o_bits):
+        return 0.0
+
+    table = TranspositionTable()
+    iterative_deepening(state, "O", time_limit=60, max_depth=3, table=table)
+    result = iterative_deepening(
+        state,
+        "O",
+        time_limit=60,
+        max_depth=3,
+        table=table,
+        evaluate=flat_evaluation,
+    )
+    assert result["score"] == 0.0
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_parallel_iterative_deepening_matches_serial(seed):
+    rng = random.Random(seed)
+    size = 4 if seed % 2 else 5
+    state, player = random_position(rng, size, size, 4, rng.randrange(2, 7))
+    # A generous time limit, so both searches reach max_depth.
+    serial = iterative_deepening(
+        state, player, time_limit=60, max_depth=3, table=TranspositionTable()
+    )
+    parallel = iterative_deepening(
+        state,
+        player,
+        time_limit=60,
+        max_depth=3,
+        table=TranspositionTable(),
+        processes=2,
+    )
+    assert parallel == serial
+
+
+def test_parallel_minimax_matches_serial():
+    rng = random.Random(0)
+    for moves in (0, 2, 4):
+        state, player = random_position(rng, 3, 3, 3, moves)
+        expected = minimax(state, player, TranspositionTable())
+        assert parallel_minimax(state, player, processes=2) == expected
@@ -0,0 +1,84 @@
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from comp469.puzzle import PuzzleGraph
+from comp469.statespace import (
+    StateSpace,
+    build_state_space,
+    diameter,
+    rank_state,
+    rank_states,
+    unrank_state,
+)
+
+GOAL = (1, 2, 3, 4, 5, 6, 7, 8, 0)
+
+
+@pytest.fixture(scope="module")
+def state_space():
+    return build_state_space()
+
+
+def random_states(count, seed=0):
+    rng = random.Random(seed)
+    return [tuple(rng.sample(range(9), 9)) for _ in range(count)]
+
+
+def test_ranks_are_lexicographic():
+    assert rank_state(tuple(range(9))) == 0
+    assert rank_state(tuple(range(8, -1, -1))) == math.factorial(9) - 1
+    states = random_states(200)
+    ranks = [rank_state(state) for state in states]
+    assert [unrank_state(rank) for rank in ranks] == states
+    assert rank_states(np.array(states, dtype=np.int8)).tolist() == ranks
+
+
+def test_successors_follow_get_neighbors(state_space):
+    assert state_space.num_states == 362880
+    assert state_space.num_edges == 967680
+    puzzle = PuzzleGraph(GOAL, GOAL)
+    for state in random_states(200, seed=1):
+        successors = state_space.successors(rank_state(state)).tolist()
+        neighbors = puzzle.get_neighbors(state)
+        assert [unrank_state(rank) for rank in successors] == neighbors
+
+
+def test_bfs_distances(state_space):
+    distances = state_space.bfs(rank_state(GOAL))
+    assert distances[rank_state((1, 2, 3, 4, 5, 6, 0, 7, 8))] == 2
+    assert distances[rank_state((8, 6, 7, 2, 5, 4, 3, 0, 1))] == 31
+    # Swapping two tiles crosses into the other half of the state space.
+    assert distances[rank_state((2, 1, 3, 4, 5, 6, 7, 8, 0))] == -1
+    histogram = state_space.distance_histogram(rank_state(GOAL))
+    assert histogram.sum() == 181440
+    assert len(histogram) == 32
+
+
+def test_diameter_and_components(state_space):
+    assert diameter(state_space, GOAL) == 31
+    labels, count = state_space.components()
+    assert count == 2
+    assert np.bincount(labels).tolist() == [181440, 181440]
+
+
+def test_save_and_load_memory_mapped(state_space, tmp_path):
+    state_space.save(str(tmp_path / "space"))
+    loaded = StateSpace.load(str(tmp_path / "space"))
+    assert isinstance(loaded.neighbors, np.memmap)
+    assert np.array_equal(loaded.offsets, state_space.offsets)
+    assert np.array_equal(loaded.neighbors, state_space.neighbors)
+    source = rank_state(GOAL)
+    assert np.array_equal(loaded.bfs(source), state_space.bfs(source))
+
+
+def test_networkx_export_matches_the_puzzle_graph(state_space):
+    pytest.importorskip("networkx")
+    start = (1, 2, 3, 4, 5, 6, 7, 0, 8)
+    graph = PuzzleGraph(start, GOAL).graph
+    exported = state_space.to_networkx(rank_state(start))
+    assert set(exported.nodes) == set(graph.nodes)
+    assert set(exported.edges) == set(graph.edges)
@@ -0,0 +1,114 @@
+import random
+
+import pytest
+
+from comp469.nqueens.annealing import simulated_annealing, simulated_annealing_stream
+from comp469.nqueens.board import create_board, place_queens
+from comp469.nqueens.genetic import (
+    genetic_algorithm_stream,
+    optimized_genetic_algorithm,
+)
+from comp469.nqueens.hill_climbing import hill_climb, hill_climb_stream
+from comp469.puzzle import ALGORITHMS, PuzzleGraph
+from comp469.streaming import Snapshot, run_stream, stalled
+
+GOAL = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+
+
+def random_board(seed):
+    return place_queens(create_board(), random.Random(seed))
+
+
+def drain(stream):
+    snapshots = []
+    while True:
+        try:
+            snapshots.append(next(stream))
+        except StopIteration as stop:
+            return stop.value, snapshots
+
+
+def test_streams_return_the_blocking_result():
+    for seed in range(3):
+        result, snapshots = drain(hill_climb_stream(random_board(seed)))
+        assert result == hill_climb(random_board(seed))
+        assert [s.iteration for s in snapshots] == list(range(1, len(snapshots) + 1))
+
+        result, snapshots = drain(
+            simulated_annealing_stream(random_board(seed), rng=random.Random(seed))
+        )
+        assert result == simulated_annealing(
+            random_board(seed), rng=random.Random(seed)
+        )
+        costs = [s.best_cost for s in snapshots]
+        assert costs == sorted(costs, reverse=True)
+
+    options = {"population_size": 20, "max_generations": 30}
+    result, _ = drain(genetic_algorithm_stream(rng=random.Random(5), **options))
+    assert result == optimized_genetic_algorithm(rng=random.Random(5), **options)
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_puzzle_streams_return_the_blocking_path(algorithm):
+    puzzle = PuzzleGraph([1, 2, 3, 4, 5, 6, 0, 7, 8], GOAL)
+    path, snapshots = drain(puzzle.search_stream(algorithm))
+    assert path == getattr(puzzle, algorithm)()
+    assert path[-1] == tuple(GOAL)
+    assert snapshots[-1].best_cost <= snapshots[0].best_cost
+
+
+def test_puzzle_stream_stops_when_its_budget_runs_out():
+    puzzle = PuzzleGraph([8, 6, 7, 2, 5, 4, 3, 0, 1], GOAL)
+    path, snapshots = drain(puzzle.search_stream("bfs", max_expansions=50))
+    assert path is None
+    assert len(snapshots) == 50
+    # An ids iteration is a whole depth.
+    path, snapshots = drain(puzzle.search_stream("ids", max_expansions=4))
+    assert path is None
+    assert [s.iteration for s in snapshots] == [1, 2, 3, 4]
+    with pytest.raises(ValueError):
+        puzzle.search_stream("no_such_search")
+
+
+def test_sending_a_budget_continues_the_same_run():
+    board = random_board(11)
+    stream = simulated_annealing_stream(
+        [row[:] for row in board], max_steps=10, rng=random.Random(11)
+    )
+    snapshots = [next(stream) for _ in range(10)]
+    assert snapshots[-1].iteration == 10
+    snapshots.append(stream.send(5))
+    result, rest = drain(stream)
+    assert [s.iteration for s in snapshots + rest] == list(range(1, 16))
+    assert result == simulated_annealing(
+        [row[:] for row in board], max_steps=15, rng=random.Random(11)
+    )
+
+
+def test_run_stream_stops_early():
+    stream = simulated_annealing_stream(
+        random_board(3), max_steps=None, rng=random.Random(3)
+    )
+    result, snapshot = run_stream(stream, lambda snapshot: snapshot.iteration == 25)
+    assert result is None
+    assert snapshot.iteration == 25
+    with pytest.raises(StopIteration):
+        next(stream)
+
+
+def test_stalled_stops_once_the_best_cost_stops_improving():
+    costs = [5, 4, 4, 3, 3, 3, 3, 2]
+    stream = (Snapshot(i, cost, None) for i, cost in enumerate(costs, 1))
+    result, snapshot = run_stream(stream, stalled(3))
+    assert result is None
+    assert snapshot.iteration == 7
+
+
+def test_annealing_survives_cooling_to_zero():
+    # At a cooling rate of 0.5 the temperature underflows to 0.0 within
+    # about 1,100 steps.
+    for seed in range(20):
+        board, attacks = simulated_annealing(
+            random_board(seed), 3000, cooling_rate=0.5, rng=random.Random(seed)
+        )
+        assert attacks >= 0
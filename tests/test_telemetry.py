@@ -0,0 +1,134 @@
+import argparse
+import json
+import random
+
+from comp469.nqueens.annealing import (
+    measure_performance_simulated_annealing,
+    simulated_annealing,
+)
+from comp469.nqueens.board import create_board, place_queens
+from comp469.nqueens.genetic import optimized_genetic_algorithm
+from comp469.nqueens.hill_climbing import hill_climb
+from comp469.puzzle import PuzzleGraph
+from comp469.telemetry import (
+    Telemetry,
+    add_telemetry_arguments,
+    export_telemetry,
+    telemetry_from_arguments,
+    write_json_lines,
+    write_prometheus,
+)
+
+PUZZLE_START = [4, 1, 3, 7, 2, 6, 0, 5, 8]
+PUZZLE_GOAL = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+
+
+def random_board(seed):
+    return place_queens(create_board(), random.Random(seed))
+
+
+def test_telemetry_does_not_change_results():
+    for seed in range(5):
+        plain = simulated_annealing(random_board(seed), rng=random.Random(seed))
+        telemetry = Telemetry("simulated_annealing")
+        instrumented = simulated_annealing(
+            random_board(seed), telemetry=telemetry, rng=random.Random(seed)
+        )
+        assert instrumented == plain
+    options = {"population_size": 20, "max_generations": 15}
+    plain = optimized_genetic_algorithm(rng=random.Random(1), **options)
+    telemetry = Telemetry("genetic_algorithm")
+    instrumented = optimized_genetic_algorithm(
+        rng=random.Random(1), telemetry=telemetry, **options
+    )
+    assert instrumented == plain
+
+
+def test_solvers_count_their_events():
+    telemetry = Telemetry("hill_climb")
+    hill_climb(random_board(0), telemetry=telemetry)
+    assert telemetry.runs == 1
+    assert telemetry.counters["evaluations"] % 56 == 0
+    assert telemetry.counters["accepted_moves"] >= 1
+
+    telemetry = Telemetry("genetic_algorithm")
+    optimized_genetic_algorithm(
+        population_size=20, max_generations=5, telemetry=telemetry, rng=random.Random(0)
+    )
+    generations = telemetry.counters["generations"]
+    assert telemetry.counters["evaluations"] == 20 * generations
+    assert set(telemetry.timers) == {"fitness", "selection", "reproduction"}
+
+    telemetry = Telemetry("puzzle_a_star")
+    PuzzleGraph(PUZZLE_START, PUZZLE_GOAL).a_star(telemetry=telemetry)
+    assert telemetry.counters["expansions"] >= 2
+
+
+def test_runs_add_up_across_a_batch():
+    telemetry = Telemetry("simulated_annealing")
+    measure_performance_simulated_annealing(3, telemetry)
+    assert telemetry.runs == 3
+    assert telemetry.counters["evaluations"] >= 3
+    assert telemetry.elapsed > 0
+
+
+def test_samples_every_k_iterations():
+    samples = []
+    telemetry = Telemetry(
+        "puzzle_bfs",
+        sample_every=10,
+        on_sample=lambda telemetry, iteration, state: samples.append(
+            (iteration, state)
+        ),
+    )
+    PuzzleGraph(PUZZLE_START, PUZZLE_GOAL).bfs(telemetry=telemetry)
+    assert samples
+    assert all(iteration % 10 == 0 for iteration, _ in samples)
+    assert all(set(state) == {"frontier"} for _, state in samples)
+
+
+def test_profile_and_memory_capture():
+    telemetry = Telemetry("hill_climb", profile=True, trace_memory=True)
+    hill_climb(random_board(1), telemetry=telemetry)
+    assert telemetry.memory_peak > 0
+    functions = [function for function, _, _ in telemetry.profile_summary()]
+    assert any("get_attacking_pairs" in function for function in functions)
+
+
+def test_exporters(tmp_path):
+    telemetry = Telemetry("hill_climb", labels={"board": 'a "quoted" label'})
+    hill_climb(random_board(2), telemetry=telemetry)
+
+    path = tmp_path / "telemetry.jsonl"
+    write_json_lines([telemetry], path)
+    write_json_lines([telemetry], path)
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(records) == 2
+    assert records[0]["counters"] == telemetry.counters
+
+    path = tmp_path / "metrics.prom"
+    write_prometheus([telemetry], str(path))
+    text = path.read_text()
+    assert "# TYPE comp469_solver_events_total counter" in text
+    evaluations = telemetry.counters["evaluations"]
+    assert (
+        'comp469_solver_events_total{board="a \\"quoted\\" label",'
+        f'event="evaluations",solver="hill_climb"}} {evaluations}'
+    ) in text
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser()
+    add_telemetry_arguments(parser)
+    return parser.parse_args(argv)
+
+
+def test_profile_without_an_exporter_is_printed(capsys):
+    assert telemetry_from_arguments(parse_arguments([]), "hill_climb") is None
+    args = parse_arguments(["--profile"])
+    telemetry = telemetry_from_arguments(args, "hill_climb")
+    hill_climb(random_board(3), telemetry=telemetry)
+    export_telemetry(args, [telemetry])
+    output = capsys.readouterr().out
+    assert output.startswith("hill_climb: 1 runs in ")
+    assert "get_attacking_pairs" in output